@@ -1,3 +1,4 @@
+from .odata import Filter
 from .uipath import UiPath
 
-__all__ = ["UiPath"]
+__all__ = ["Filter", "UiPath"]
@@ -9,15 +9,55 @@ Use these models to validate and serialize data exchanged with UiPath Orchestrat
 Notes
 -----
 - All models use field aliases to match UiPath Orchestrator API field names.
+- All models share the OrchestratorModel configuration (alias-only population, extra keys ignored).
 - Some fields are optional and default to None if not provided.
 - Validators are included where necessary to transform or extract data.
 """
 
-from datetime import datetime
-from pydantic import BaseModel, Field, validator
+from typing import Annotated, Generic, Literal, TypeVar
+from pydantic import AwareDatetime, BaseModel, BeforeValidator, ConfigDict, Field, TypeAdapter
 
 
-class ListAssets(BaseModel):
+# Closed value sets of UiPath Orchestrator enums
+JobState = Literal[
+    "Pending", "Running", "Stopping", "Terminating", "Faulted", "Successful", "Stopped", "Suspended", "Resumed"
+]
+LogLevel = Literal["Trace", "Info", "Warn", "Error", "Fatal"]
+
+
+def _extract_version(value):
+    """
+    Extract the first robot version from the RobotVersions payload.
+
+    Parameters
+    ----------
+    value : Any
+        Raw RobotVersions value, typically a list of dicts with a "Version" key.
+
+    Returns
+    -------
+    str or None
+        Version of the first entry, or None if the payload is empty or malformed.
+    """
+    try:
+        return value[0]["Version"]
+    except (TypeError, KeyError, IndexError):
+        return None
+
+
+class OrchestratorModel(BaseModel):
+    """
+    Define the shared configuration for UiPath Orchestrator models.
+
+    Populate fields by their API alias only and ignore any extra keys returned by the API, so the validator probes a
+    single key per field. Build the validator when the class is defined (at import) rather than on first use, so the
+    first API response does not pay the schema build cost.
+    """
+
+    model_config = ConfigDict(populate_by_name=False, extra="ignore", validate_assignment=False, defer_build=False)
+
+
+class ListAssets(OrchestratorModel):
     """
     Define the data structure for list_assets() responses.
 
@@ -73,7 +113,7 @@ class ListAssets(BaseModel):
     description: str | None = Field(alias="Description", default=None)
 
 
-class ListBuckets(BaseModel):
+class ListBuckets(OrchestratorModel):
     """
     Define the data structure for list_buckets() responses.
 
@@ -97,7 +137,7 @@ class ListBuckets(BaseModel):
     description: str | None = Field(alias="Description", default=None)
 
 
-class ListCalendars(BaseModel):
+class ListCalendars(OrchestratorModel):
     """
     Define the data structure for list_calendars() responses.
 
@@ -110,7 +150,7 @@ class ListCalendars(BaseModel):
         Specify the unique identifier of the calendar.
     name : str
         Specify the name of the calendar.
-    excluded_dates : list
+    excluded_dates : list of str
         List the dates excluded from the calendar.
     time_zone_id : str, optional
         Specify the time zone ID of the calendar, if available.
@@ -118,11 +158,11 @@ class ListCalendars(BaseModel):
 
     id: int = Field(alias="Id")
     name: str = Field(alias="Name")
-    excluded_dates: list = Field(alias="ExcludedDates")
+    excluded_dates: list[str] = Field(alias="ExcludedDates")
     time_zone_id: str | None = Field(alias="TimeZoneId", default=None)
 
 
-class ListEnvironments(BaseModel):
+class ListEnvironments(OrchestratorModel):
     """
     Define the data structure for list_environments() responses.
 
@@ -146,7 +186,7 @@ class ListEnvironments(BaseModel):
     description: str | None = Field(alias="Description", default=None)
 
 
-class ListJobs(BaseModel):
+class ListJobs(OrchestratorModel):
     """
     Define the data structure for list_jobs() responses.
 
@@ -173,7 +213,7 @@ class ListJobs(BaseModel):
         Specify the start time of the job, if available.
     end_time : datetime, optional
         Specify the end time of the job, if available.
-    state : str
+    state : JobState
         Specify the current state of the job.
     source : str
         Specify the source of the job.
@@ -185,14 +225,14 @@ class ListJobs(BaseModel):
     host_machine_name: str | None = Field(alias="HostMachineName", default=None)
     type: str = Field(alias="Type")
     starting_schedule_id: int | None = Field(alias="StartingScheduleId", default=None)
-    creation_time: datetime | None = Field(alias="CreationTime", default=None)
-    start_time: datetime | None = Field(alias="StartTime", default=None)
-    end_time: datetime | None = Field(alias="EndTime", default=None)
-    state: str = Field(alias="State")
+    creation_time: AwareDatetime | None = Field(alias="CreationTime", default=None)
+    start_time: AwareDatetime | None = Field(alias="StartTime", default=None)
+    end_time: AwareDatetime | None = Field(alias="EndTime", default=None)
+    state: JobState = Field(alias="State")
     source: str = Field(alias="Source")
 
 
-class ListMachines(BaseModel):
+class ListMachines(OrchestratorModel):
     """
     Define the data structure for list_machines() responses.
 
@@ -223,20 +263,12 @@ class ListMachines(BaseModel):
     type: str = Field(alias="Type")
     non_production_slots: int = Field(alias="NonProductionSlots")
     unattended_slots: int = Field(alias="UnattendedSlots")
-    robot_versions: str | None = Field(alias="RobotVersions", default=None)
-
-    # @field_validator("RobotVersions", mode="before")
-    # @classmethod
-    @validator("robot_versions", pre=True)
-    def extract_robot_version(cls, value):
-        # if len(value) > 0:
-        #     return value[0]["Version"]
-        if isinstance(value, list) and len(value) > 0 and isinstance(value[0], dict):
-            return value[0].get("Version")
-        return None
+    robot_versions: Annotated[str | None, BeforeValidator(_extract_version)] = Field(
+        alias="RobotVersions", default=None
+    )
 
 
-class ListProcesses(BaseModel):
+class ListProcesses(OrchestratorModel):
     """
     Define the data structure for list_processes() responses.
 
@@ -263,12 +295,12 @@ class ListProcesses(BaseModel):
     # title: str = Field(alias="Title")
     key: str = Field(alias="Key")
     version: str = Field(alias="Version")
-    published: datetime = Field(alias="Published")
+    published: AwareDatetime = Field(alias="Published")
     authors: str = Field(alias="Authors")
     description: str | None = Field(alias="Description", default=None)
 
 
-class ListQueues(BaseModel):
+class ListQueues(OrchestratorModel):
     """
     Define the data structure for list_queues() responses.
 
@@ -289,9 +321,9 @@ class ListQueues(BaseModel):
     description: str | None = Field(alias="Description", default=None)
 
 
-class ListQueueItems(BaseModel):
+class QueueItem(OrchestratorModel):
     """
-    Define the data structure for list_queue_items() responses.
+    Define the data structure for list_queue_items() and get_queue_item() responses.
 
     Specify fields for UiPath Orchestrator queue item metadata, including identifiers, queue definition IDs, statuses,
     references, creation times, processing start and end times, retry numbers, and specific data.
@@ -322,54 +354,19 @@ class ListQueueItems(BaseModel):
     queue_definition_id: int = Field(alias="QueueDefinitionId")
     status: str = Field(alias="Status")
     reference: str = Field(alias="Reference")
-    creation_time: datetime = Field(alias="CreationTime")
-    start_processing: datetime | None = Field(alias="StartProcessing", default=None)
-    end_processing: datetime | None = Field(alias="EndProcessing", default=None)
+    creation_time: AwareDatetime = Field(alias="CreationTime")
+    start_processing: AwareDatetime | None = Field(alias="StartProcessing", default=None)
+    end_processing: AwareDatetime | None = Field(alias="EndProcessing", default=None)
     retry_number: int = Field(alias="RetryNumber")
     specific_data: str = Field(alias="SpecificData")
 
 
-class GetQueueItem(BaseModel):
-    """
-    Define the data structure for get_queue_item() responses.
+# list_queue_items() and get_queue_item() return the same record shape
+ListQueueItems = QueueItem
+GetQueueItem = QueueItem
 
-    Specify fields for UiPath Orchestrator queue item metadata, including identifiers, queue definition IDs, statuses,
-    references, creation times, processing start and end times, retry numbers, and specific data.
 
-    Parameters
-    ----------
-    id : int
-        Specify the unique identifier of the queue item.
-    queue_definition_id : int
-        Specify the unique identifier of the queue definition.
-    status : str
-        Specify the status of the queue item.
-    reference : str
-        Specify the reference associated with the queue item.
-    creation_time : datetime
-        Specify the creation time of the queue item.
-    start_processing : datetime, optional
-        Specify the time when processing started, if available.
-    end_processing : datetime, optional
-        Specify the time when processing ended, if available.
-    retry_number : int
-        Specify the retry number for the queue item.
-    specific_data : str
-        Specify the specific data associated with the queue item.
-    """
-
-    id: int = Field(alias="Id")
-    queue_definition_id: int = Field(alias="QueueDefinitionId")
-    status: str = Field(alias="Status")
-    reference: str = Field(alias="Reference")
-    creation_time: datetime = Field(alias="CreationTime")
-    start_processing: datetime | None = Field(alias="StartProcessing", default=None)
-    end_processing: datetime | None = Field(alias="EndProcessing", default=None)
-    retry_number: int = Field(alias="RetryNumber")
-    specific_data: str = Field(alias="SpecificData")
-
-
-class AddQueueItem(BaseModel):
+class AddQueueItem(OrchestratorModel):
     """
     Define the data structure for add_queue_item() responses.
 
@@ -391,7 +388,7 @@ class AddQueueItem(BaseModel):
     queue_definition_id: int = Field(alias="QueueDefinitionId")
 
 
-class ListReleases(BaseModel):
+class ListReleases(OrchestratorModel):
     """
     Define the data structure for list_releases() responses.
 
@@ -419,7 +416,7 @@ class ListReleases(BaseModel):
     environment_id: str | None = Field(alias="EnvironmentId", default=None)
 
 
-class ListRobots(BaseModel):
+class ListRobots(OrchestratorModel):
     """
     Define the data structure for list_robots() responses.
 
@@ -450,7 +447,7 @@ class ListRobots(BaseModel):
     robot_environments: str = Field(alias="RobotEnvironments")
 
 
-class ListRobotLogs(BaseModel):
+class ListRobotLogs(OrchestratorModel):
     """
     Define the data structure for list_robot_logs() responses.
 
@@ -463,34 +460,34 @@ class ListRobotLogs(BaseModel):
         Specify the unique identifier of the robot log.
     job_key : str
         Specify the unique key of the job associated with the log.
-    level : str
+    level : LogLevel
         Specify the log level.
     windows_identity : str
         Specify the Windows identity associated with the log.
     process_name : str
         Specify the name of the process that generated the log.
-    time_stamp : str
+    time_stamp : datetime
         Specify the timestamp of the log entry.
     message : str
         Specify the log message.
     robot_name : str
         Specify the name of the robot that generated the log.
-    Machine_id : int
+    machine_id : int
         Specify the unique identifier of the machine associated with the log.
     """
 
     id: int = Field(alias="Id")
     job_key: str = Field(alias="JobKey")
-    level: str = Field(alias="Level")
+    level: LogLevel = Field(alias="Level")
     windows_identity: str = Field(alias="WindowsIdentity")
     process_name: str = Field(alias="ProcessName")
-    time_stamp: str = Field(alias="TimeStamp")
+    time_stamp: AwareDatetime = Field(alias="TimeStamp")
     message: str = Field(alias="Message")
     robot_name: str = Field(alias="RobotName")
-    Machine_id: int = Field(alias="MachineId")
+    machine_id: int = Field(alias="MachineId")
 
 
-class ListRoles(BaseModel):
+class ListRoles(OrchestratorModel):
     """
     Define the data structure for list_roles() responses.
 
@@ -514,7 +511,7 @@ class ListRoles(BaseModel):
     type: str = Field(alias="Type")
 
 
-class ListSchedules(BaseModel):
+class ListSchedules(OrchestratorModel):
     """
     Define the data structure for list_schedules() responses.
 
@@ -551,7 +548,7 @@ class ListSchedules(BaseModel):
     enabled: bool = Field(alias="Enabled")
 
 
-class ListSessions(BaseModel):
+class ListSessions(OrchestratorModel):
     """
     Define the data structure for list_sessions() responses.
 
@@ -570,7 +567,7 @@ class ListSessions(BaseModel):
         Specify the name of the machine, if available.
     state : str
         Specify the current state of the session.
-    reporting_time : str
+    reporting_time : datetime
         Specify the reporting time of the session.
     organization_unit_id : str, optional
         Specify the unique identifier of the organization unit, if available.
@@ -583,9 +580,53 @@ class ListSessions(BaseModel):
     host_machine_name: str = Field(alias="HostMachineName")
     machine_name: str | None = Field(alias="MachineName", default=None)
     state: str = Field(alias="State")
-    reporting_time: str = Field(alias="ReportingTime")
+    reporting_time: AwareDatetime = Field(alias="ReportingTime")
     organization_unit_id: str | None = Field(alias="OrganizationUnitId", default=None)
     folder_name: str | None = Field(alias="FolderName", default=None)
 
 
+# Record model of an OData page
+RecordT = TypeVar("RecordT", bound=OrchestratorModel)
+
+
+class ODataPage(OrchestratorModel, Generic[RecordT]):
+    """
+    Define the data structure of an OData list response.
+
+    Parameters
+    ----------
+    value : list of RecordT
+        Specify the records of the page.
+    count : int, optional
+        Specify the total number of records, if requested with $count.
+    """
+
+    value: list[RecordT] = Field(alias="value")
+    count: int | None = Field(alias="@odata.count", default=None)
+
+
+# Page adapters
+# Validate the raw bytes of an OData page and dump its records, each in a single pydantic-core call
+PAGE_ADAPTERS: dict[type[OrchestratorModel], TypeAdapter] = {
+    model: TypeAdapter(ODataPage[model])
+    for model in (
+        ListAssets,
+        ListBuckets,
+        ListCalendars,
+        ListEnvironments,
+        ListJobs,
+        ListMachines,
+        ListProcesses,
+        ListQueues,
+        QueueItem,
+        ListReleases,
+        ListRobots,
+        ListRobotLogs,
+        ListRoles,
+        ListSchedules,
+        ListSessions,
+    )
+}
+
+
 # eof
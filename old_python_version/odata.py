@@ -0,0 +1,151 @@
+"""
+OData query helpers for the UiPath Orchestrator client.
+
+This module provides a small builder for OData $filter expressions, so that filters can be composed from fields and
+Python values instead of hand-written strings. Literals are quoted and escaped according to the OData syntax, and the
+resulting expression is rendered once when the filter is built.
+
+Intended for use with the `filter` parameter of the UiPath client methods.
+"""
+
+import datetime
+import math
+import uuid
+from typing import Any
+
+
+class Filter(object):
+    """
+    Represent an OData $filter expression.
+
+    Build filters with the comparison constructors and combine them with `and_`/`or_` (or the `&`/`|` operators).
+    The expression string is rendered once at construction; `str(filter)` returns it. Filters are immutable, compare
+    equal when their expressions are equal and can be used as dictionary keys.
+
+    Parameters
+    ----------
+    expression : str
+        OData filter expression.
+
+    Examples
+    --------
+    >>> str(Filter.eq("QueueDefinitionId", 42) & Filter.eq("Status", "New"))
+    "(QueueDefinitionId eq 42) and (Status eq 'New')"
+    """
+
+    __slots__ = ("_expression",)
+
+    def __init__(self, expression: str) -> None:
+        self._expression = expression
+
+    @staticmethod
+    def _literal(value: Any) -> str:
+        """
+        Render a Python value as an OData literal.
+
+        Parameters
+        ----------
+        value : Any
+            None, bool, int, float, str, uuid.UUID or datetime.datetime. Naive datetimes are treated as UTC, and
+            non-finite floats are rendered as NaN, INF or -INF.
+
+        Returns
+        -------
+        str
+            OData literal, e.g. "null", "true", "42", "'O''Brien'" or "2024-01-01T00:00:00+00:00".
+        """
+        if value is None:
+            return "null"
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, float) and not math.isfinite(value):
+            return "NaN" if math.isnan(value) else ("INF" if value > 0 else "-INF")
+        if isinstance(value, (int, float, uuid.UUID)):
+            return str(value)
+        if isinstance(value, datetime.datetime):
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=datetime.timezone.utc)
+            return value.isoformat()
+        if isinstance(value, str):
+            return "'" + value.replace("'", "''") + "'"
+
+        raise TypeError(f"Unsupported OData literal type: {type(value).__name__}")
+
+    @classmethod
+    def _compare(cls, field: str, operator: str, value: Any) -> "Filter":
+        return cls(f"{field} {operator} {cls._literal(value)}")
+
+    @classmethod
+    def eq(cls, field: str, value: Any) -> "Filter":
+        """
+        Build a filter matching records whose `field` equals `value`.
+        """
+        return cls._compare(field, "eq", value)
+
+    @classmethod
+    def ne(cls, field: str, value: Any) -> "Filter":
+        """
+        Build a filter matching records whose `field` differs from `value`.
+        """
+        return cls._compare(field, "ne", value)
+
+    @classmethod
+    def gt(cls, field: str, value: Any) -> "Filter":
+        """
+        Build a filter matching records whose `field` is greater than `value`.
+        """
+        return cls._compare(field, "gt", value)
+
+    @classmethod
+    def ge(cls, field: str, value: Any) -> "Filter":
+        """
+        Build a filter matching records whose `field` is greater than or equal to `value`.
+        """
+        return cls._compare(field, "ge", value)
+
+    @classmethod
+    def lt(cls, field: str, value: Any) -> "Filter":
+        """
+        Build a filter matching records whose `field` is less than `value`.
+        """
+        return cls._compare(field, "lt", value)
+
+    @classmethod
+    def le(cls, field: str, value: Any) -> "Filter":
+        """
+        Build a filter matching records whose `field` is less than or equal to `value`.
+        """
+        return cls._compare(field, "le", value)
+
+    def and_(self, other: "Filter | str") -> "Filter":
+        """
+        Combine with another filter; both must match.
+        """
+        return Filter(f"({self}) and ({other})")
+
+    def or_(self, other: "Filter | str") -> "Filter":
+        """
+        Combine with another filter; either must match.
+        """
+        return Filter(f"({self}) or ({other})")
+
+    def __and__(self, other: "Filter | str") -> "Filter":
+        return self.and_(other)
+
+    def __or__(self, other: "Filter | str") -> "Filter":
+        return self.or_(other)
+
+    def __str__(self) -> str:
+        return self._expression
+
+    def __repr__(self) -> str:
+        return f"Filter({self._expression!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Filter) and other._expression == self._expression
+
+    def __hash__(self) -> int:
+        return hash(self._expression)
+
+
+# eof
@@ -11,7 +11,7 @@ Features
 - List, create, update, and delete assets, buckets, calendars, environments, jobs, machines, processes, queues,
 releases, robots, roles, schedules, and sessions.
 - Upload and delete files in storage buckets.
-- Add, update, and delete queue items.
+- Add (individually or in bulk), update, and delete queue items.
 - Retrieve and filter logs and job information.
 - Export API responses to JSON files for auditing or further processing.
 
@@ -26,12 +26,20 @@ Intended for use as a utility library in broader data engineering and automation
 """
 
 # import base64
+import concurrent.futures
 import dataclasses
-import json
+import functools
 import logging
-from typing import Any, Type
+import random
+import threading
+import time
+from typing import Any, Callable, Iterator, Type
+from urllib.parse import urlsplit
 import requests
-from pydantic import BaseModel, parse_obj_as
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from pydantic import BaseModel
+from pydantic_core import from_json, to_json
 from .models import (
     ListAssets,
     ListBuckets,
@@ -50,11 +58,162 @@ from .models import (
     ListRoles,
     ListSchedules,
     ListSessions,
+    PAGE_ADAPTERS,
 )
+from .odata import Filter
 
 # Creates a logger for this module
 logger = logging.getLogger(__name__)
 
+# Retry policy for throttled (HTTP 429) non-idempotent requests
+# Idempotent methods are retried by the session HTTPAdapter, with the same Retry-After ceiling
+_THROTTLE_RETRIES = 3
+_THROTTLE_BACKOFF = 0.5
+_THROTTLE_MAX_WAIT = 30.0
+
+# Default (connect, read) timeout in seconds for every request, see UiPath(timeout=...)
+_TIMEOUT = (3.05, 30)
+
+
+@functools.lru_cache(maxsize=None)
+def _select_clause(model: Type[BaseModel]) -> str:
+    """
+    Build the OData $select clause for a Pydantic model.
+
+    Join the API aliases of the model fields once per model class and reuse the string on every request.
+
+    Parameters
+    ----------
+    model : Type[BaseModel]
+        Pydantic BaseModel class whose field aliases are selected.
+
+    Returns
+    -------
+    str
+        Comma-separated list of field aliases.
+    """
+    return ",".join(field.alias for field in model.model_fields.values() if field.alias is not None)
+
+
+def _load_page(
+    content: bytes | bytearray,
+    model: Type[BaseModel],
+    validate: bool = True,
+) -> tuple[list[dict], int | None]:
+    """
+    Deserialize the body of an OData list response.
+
+    Validate the JSON bytes in a single pass with the page adapter of `model`, then dump the records to dictionaries.
+
+    Parameters
+    ----------
+    content : bytes or bytearray
+        JSON body of the response.
+    model : Type[BaseModel]
+        Pydantic BaseModel class of the records in the list.
+    validate : bool, optional
+        Validate the records against `model`. If False, return them as sent by the API. Default is True.
+
+    Returns
+    -------
+    tuple of (list of dict, int or None)
+        Records of the page and the total number of records ("@odata.count"), if requested.
+    """
+    if not validate:
+        # Deserialize json bytes without validation
+        page = from_json(content)
+        return page["value"], page.get("@odata.count")
+
+    # Deserialize and validate json bytes
+    adapter = PAGE_ADAPTERS[model]
+    page = adapter.validate_json(content)
+    # Convert the records to a list of dicts
+    return adapter.dump_python(page, include={"value"})["value"], page.count
+
+
+def _default_url_auth(url_base: str) -> str:
+    """
+    Derive the identity token endpoint from the Orchestrator base URL.
+
+    The token endpoint lives under the organization, i.e. the first path segment of `url_base`.
+
+    Parameters
+    ----------
+    url_base : str
+        Orchestrator base URL, e.g. "https://cloud.uipath.com/<organization>/<tenant>/orchestrator_".
+
+    Returns
+    -------
+    str
+        Token endpoint URL, e.g. "https://cloud.uipath.com/<organization>/identity_/connect/token".
+    """
+    parts = urlsplit(url_base)
+    organization = parts.path.strip("/").split("/", 1)[0]
+    prefix = f"{parts.scheme}://{parts.netloc}/{organization}" if organization else f"{parts.scheme}://{parts.netloc}"
+    return f"{prefix}/identity_/connect/token"
+
+
+class _RateLimiter(object):
+    """
+    Throttle outgoing requests with a thread-safe token bucket.
+
+    The bucket holds up to `burst` tokens and refills at `rate` tokens per second. Each request takes one token and
+    blocks until a token is available.
+
+    Parameters
+    ----------
+    rate : float
+        Number of requests allowed per second.
+    burst : int, optional
+        Maximum number of requests sent back to back. Default is max(1, int(rate)).
+    """
+
+    def __init__(self, rate: float, burst: int | None = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+
+        self._rate = rate
+        self._capacity = float(burst if burst is not None else max(1, int(rate)))
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Take one token from the bucket, waiting for the refill if it is empty.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+
+class _RateLimitedAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that takes a token from a `_RateLimiter` before sending each request.
+
+    Parameters
+    ----------
+    limiter : _RateLimiter
+        Token bucket shared by every request sent through the adapter.
+    **kwargs
+        Keyword arguments passed to `requests.adapters.HTTPAdapter`.
+    """
+
+    def __init__(self, limiter: _RateLimiter, **kwargs: Any) -> None:
+        self._limiter = limiter
+        super().__init__(**kwargs)
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        self._limiter.acquire()
+        return super().send(request, **kwargs)
+
 
 class UiPath(object):
     """
@@ -75,7 +234,16 @@ class UiPath(object):
     scope : str
         The scope for authentication.
     custom_logger : logging.Logger, optional
-        Logger instance to use. If None, a default logger is created.
+        Logger instance to use. If None, the module logger is used.
+    rate_limit : float, optional
+        Maximum number of requests per second. If None, requests are not throttled.
+    url_auth : str, optional
+        Identity token endpoint. If None, it is derived from the organization in `url_base`.
+    validate : bool, optional
+        Validate responses with the Pydantic models. If False, raw JSON records are returned. Default is True.
+    timeout : float, tuple of float or None, optional
+        Default (connect, read) timeout in seconds for every request. If None, wait indefinitely. Default is
+        (3.05, 30).
 
     Attributes
     ----------
@@ -85,9 +253,26 @@ class UiPath(object):
         Session object for HTTP requests.
     _configuration : UiPath.Configuration
         Configuration dataclass holding credentials and tokens.
+    _url_odata : str
+        Base URL of the Orchestrator OData endpoints.
+    _retry : urllib3.util.retry.Retry
+        Retry policy of the session adapter.
+    _limiter : _RateLimiter or None
+        Token bucket throttling requests, if `rate_limit` is set.
+    _validate : bool
+        Whether responses are validated with the Pydantic models.
+    _timeout : float, tuple of float or None
+        Default timeout of every request.
+    _etag_cache : dict
+        ETag and body of the last response per (path, fid, filter) for the slow-changing list endpoints.
+
+    Examples
+    --------
+    >>> with UiPath(url_base, client_id, refresh_token, scope) as client:
+    ...     response = client.list_assets(fid="<folder-id>")
     """
 
-    @dataclasses.dataclass
+    @dataclasses.dataclass(slots=True)
     class Configuration:
         """
         Store configuration parameters for the UiPath client.
@@ -107,6 +292,8 @@ class UiPath(object):
             The access token obtained after authentication.
         scope : str or None
             The scope for authentication.
+        url_auth : str or None
+            The identity token endpoint used by `auth`.
         """
 
         url_base: str | None = None
@@ -114,8 +301,9 @@ class UiPath(object):
         refresh_token: str | None = None
         token: str | None = None
         scope: str | None = None
+        url_auth: str | None = None
 
-    @dataclasses.dataclass
+    @dataclasses.dataclass(slots=True, frozen=True)
     class Response:
         """
         Represent the response from a UiPath client method.
@@ -147,6 +335,10 @@ class UiPath(object):
         refresh_token: str,
         scope: str,
         custom_logger: logging.Logger | None = None,
+        rate_limit: float | None = None,
+        url_auth: str | None = None,
+        validate: bool = True,
+        timeout: float | tuple[float, float] | None = _TIMEOUT,
     ) -> None:
         """
         Initialize the UiPath Cloud client with the provided credentials and configuration.
@@ -162,7 +354,17 @@ class UiPath(object):
         scope : str
             Specify the scope for authentication.
         custom_logger : logging.Logger, optional
-            Pass a custom logger instance to use. If None, create a default logger.
+            Pass a custom logger instance to use. If None, use the module logger.
+        rate_limit : float, optional
+            Maximum number of requests per second sent to Orchestrator. If None, requests are not throttled.
+        url_auth : str, optional
+            Identity token endpoint. If None, derive it from the organization in `url_base`.
+        validate : bool, optional
+            Validate responses with the Pydantic models. If False, return the raw JSON records with the API field
+            names, skipping validation. Default is True.
+        timeout : float, tuple of float or None, optional
+            Default (connect, read) timeout in seconds for every request. Raise it for slow queries, e.g. large
+            robot log or queue item filters. If None, wait indefinitely. Default is (3.05, 30).
 
         Notes
         -----
@@ -170,11 +372,27 @@ class UiPath(object):
         API.
         """
         # Init logging
-        # Use provided logger or create a default one
-        self._logger = custom_logger or logging.getLogger(name=__name__)
+        # Use provided logger or the module logger
+        self._logger = custom_logger or logger
 
         # Init variables
         self._session: requests.Session = requests.Session()
+        self._session.headers.update({"Content-Type": "application/json"})
+        self._session.verify = True
+
+        # Retry policy (idempotent methods only)
+        self._retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=True,
+            retry_after_max=_THROTTLE_MAX_WAIT,
+            raise_on_status=False,
+        )
+        # Token bucket shared by all threads using this client
+        self._limiter = None if rate_limit is None else _RateLimiter(rate=rate_limit)
+        # Connection pool
+        self.configure_pool(pool_maxsize=64, pool_connections=32)
 
         # Credentials/Configuration
         self._configuration = self.Configuration(
@@ -183,34 +401,96 @@ class UiPath(object):
             refresh_token=refresh_token,
             token=None,
             scope=scope,
+            url_auth=url_auth or _default_url_auth(url_base),
         )
+        self._url_odata = f"{url_base}/odata"
+        self._validate = validate
+        self._timeout = timeout
+
+        # ETag and body of the last response per cached endpoint
+        self._etag_cache: dict[tuple, tuple[str, bytes]] = {}
 
         # Authenticate
         self.auth()
 
-    def __del__(self) -> None:
+    def __enter__(self) -> "UiPath":
+        """
+        Enter the runtime context and return the client itself.
+
+        Returns
+        -------
+        UiPath
+            The client instance.
+        """
+        return self
+
+    def __exit__(self, *exc: object) -> None:
         """
-        Finalize the SharePoint client instance and release resources.
+        Exit the runtime context and release resources.
 
-        Close the internal HTTP session and log an informational message indicating cleanup.
+        Close the client, see `close`.
 
         Parameters
         ----------
-        self : SharePoint
-            The SharePoint client instance.
+        *exc : object
+            Exception type, value and traceback, if any. Exceptions are not suppressed.
 
         Returns
         -------
         None
+        """
+        self.close()
 
-        Notes
-        -----
-        This method is called when the instance is about to be destroyed. Ensure the HTTP session is closed and log
-        cleanup.
+    def close(self) -> None:
         """
-        self._logger.info(msg="Cleans the house at the exit")
+        Release the resources held by the client.
+
+        Close the internal HTTP session and its pooled connections. Call this when the client is not used as a context
+        manager, e.g. when one client is created per tenant in a long-running script.
+
+        Returns
+        -------
+        None
+        """
+        self._logger.info("Cleans the house at the exit")
         self._session.close()
 
+    def configure_pool(self, pool_maxsize: int, pool_connections: int = 32) -> None:
+        """
+        Resize the HTTP connection pool of the session.
+
+        Mount a new adapter with the given pool sizes, keeping the retry policy and rate limiter of the client. Raise
+        `pool_maxsize` to at least the number of threads sharing the client, otherwise urllib3 discards connections and
+        repeats the TLS handshake. Call this before issuing concurrent requests.
+
+        Parameters
+        ----------
+        pool_maxsize : int
+            Maximum number of connections kept alive per host.
+        pool_connections : int, optional
+            Number of per-host pools to cache. Default is 32.
+
+        Returns
+        -------
+        None
+        """
+        if self._limiter is None:
+            adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=self._retry)
+        else:
+            adapter = _RateLimitedAdapter(
+                limiter=self._limiter,
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                max_retries=self._retry,
+            )
+
+        # Replace the current adapter and release its pooled connections
+        previous = self._session.adapters.get("https://")
+        self._session.mount(prefix="https://", adapter=adapter)
+        self._session.mount(prefix="http://", adapter=adapter)
+        if previous is not None:
+            previous.close()
+
     def is_auth(self) -> bool:
         """
         Check if authentication was successful.
@@ -219,14 +499,8 @@ class UiPath(object):
         -------
         bool
             True if authentication was successful, otherwise False.
-
-        Notes
-        -----
-        Log the authentication status check.
         """
-        self._logger.info(msg="Checking if authentication is being established with UiPath Orchestrator.")
-
-        return False if self._configuration.token is None else True
+        return self._configuration.token is not None
 
     def auth(self) -> None:
         """
@@ -254,19 +528,21 @@ class UiPath(object):
         ValueError
             If the response body does not contain a valid JSON access_token.
         """
-        self._logger.info(msg="Authenticating with UiPath Orchestrator using client credentials.")
+        self._logger.info("Authenticating with UiPath Orchestrator using client credentials.")
 
         # Request headers
         # headers = {"Connection": "keep-alive",
         #            "Content-Type": "application/json"}
+        # Drop the session Authorization header so a stale token is not sent
         headers = {
             "Connection": "keep-alive",
             "Content-Type": "application/x-www-form-urlencoded",
+            "Authorization": None,
         }
 
         # Authorization URL
         # url_auth = "https://account.uipath.com/oauth/token"
-        url_auth = "https://cloud.uipath.com/adidas/identity_/connect/token"
+        url_auth = self._configuration.url_auth
 
         # Request body
         # body = {"grant_type": "refresh_token",
@@ -287,52 +563,133 @@ class UiPath(object):
         }
 
         # Request
-        response = self._session.post(url=url_auth, data=body, headers=headers)
+        response = self._request(method="POST", url=url_auth, data=body, headers=headers)
 
         # Log response code
-        self._logger.info(msg=f"HTTP Status Code {response.status_code}")
+        self._logger.info("HTTP Status Code %s", response.status_code)
 
         # Return valid response
         if response.status_code == 200:
-            self._configuration.token = json.loads(response.content.decode("utf-8"))["access_token"]
+            self._configuration.token = from_json(response.content)["access_token"]
+            self._session.headers.update({"Authorization": f"Bearer {self._configuration.token}"})
 
-    def _export_to_json(self, content: bytes, save_as: str | None) -> None:
+    def _request(self, method: str, url: str, save_as: str | None = None, **kwargs: Any) -> requests.Response:
         """
-        Export response content to a JSON file.
+        Send an HTTP request through the session, backing off when Orchestrator throttles it.
 
-        Save the given bytes content to a file in binary mode if a file path is provided.
+        Idempotent methods are already retried on 429 and 5xx responses by the session HTTPAdapter. Other methods (POST)
+        are only retried on 429 Too Many Requests, which guarantees the server did not process the request. The wait
+        honours the Retry-After header, capped at `_THROTTLE_MAX_WAIT`, otherwise it grows exponentially with jitter.
+
+        If `save_as` is set, the response is streamed: the body of a successful response is left unread for
+        `_read_content` to export, while the body of any other response is read to release the connection.
 
         Parameters
         ----------
-        content : bytes
-            Response content to export.
-        save_as : str or None
-            File path to save the JSON content. If None, do not save.
+        method : str
+            HTTP method, e.g. "GET" or "POST".
+        url : str
+            Request URL.
+        save_as : str or None, optional
+            File path the JSON content of a successful response will be exported to. If None, do not stream.
+        **kwargs
+            Keyword arguments passed to `requests.Session.request`. The timeout defaults to the client timeout.
 
         Returns
         -------
-        None
-            This function does not return any value.
+        requests.Response
+            The last response received.
+        """
+        kwargs.setdefault("timeout", self._timeout)
 
-        Notes
-        -----
-        If `save_as` is specified, write the content to the file in binary mode.
+        for attempt in range(_THROTTLE_RETRIES + 1):
+            response = self._session.request(method=method, url=url, stream=save_as is not None, **kwargs)
+
+            # Methods allowed by the mounted retry policy (None means all) are retried by the HTTPAdapter
+            allowed_methods = self._retry.allowed_methods
+            retried_by_adapter = allowed_methods is None or method.upper() in allowed_methods
+            if response.status_code != 429 or retried_by_adapter or attempt == _THROTTLE_RETRIES:
+                break
+
+            # Wait as instructed by the server, otherwise exponential backoff with jitter
+            try:
+                delay = max(0.0, min(_THROTTLE_MAX_WAIT, float(response.headers["Retry-After"])))
+            except (KeyError, ValueError):
+                delay = min(_THROTTLE_MAX_WAIT, _THROTTLE_BACKOFF * 2**attempt) * random.uniform(0.5, 1.0)
+
+            self._logger.warning("HTTP 429 Too Many Requests, retrying %s in %.1f s", method, delay)
+            response.close()
+            time.sleep(delay)
+
+        if save_as is not None and response.status_code not in (200, 201):
+            # Read the body to release the connection
+            _ = response.content
+
+        return response
+
+    def _read_content(self, response: requests.Response, save_as: str | None = None) -> bytes | bytearray:
+        """
+        Read the body of a successful response, exporting it to a JSON file if requested.
+
+        Parameters
+        ----------
+        response : requests.Response
+            Response object returned by `_request` with the same `save_as`.
+        save_as : str or None, optional
+            File path to save the JSON content. If None, do not save the content.
+
+        Returns
+        -------
+        bytes or bytearray
+            JSON content of the response.
+        """
+        if save_as is None:
+            return response.content
+
+        return self._export_to_json(response=response, save_as=save_as)
+
+    def _export_to_json(self, response: requests.Response, save_as: str) -> bytearray:
+        """
+        Stream the content of a response to a JSON file.
+
+        Write the body to the file chunk by chunk as it is downloaded, and accumulate the chunks into a single buffer
+        that is returned for deserialization, so the body is held once in memory.
+
+        Parameters
+        ----------
+        response : requests.Response
+            Response object from an API request sent with `stream=True`.
+        save_as : str
+            File path to save the JSON content.
+
+        Returns
+        -------
+        bytearray
+            JSON content of the response.
         """
-        if save_as is not None:
-            self._logger.info(msg="Exports response to JSON file.")
-            with open(file=save_as, mode="wb") as file:
-                file.write(content)
+        self._logger.info("Exports response to JSON file.")
+
+        content = bytearray()
+        with open(file=save_as, mode="wb") as file:
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                file.write(chunk)
+                content += chunk
+
+        return content
 
     def _handle_response(
-        self, response: requests.Response, model: Type[BaseModel], rtype: str = "scalar"
+        self,
+        content: bytes | bytearray,
+        model: Type[BaseModel],
+        rtype: str = "scalar",
     ) -> dict | list[dict]:
         """
         Handle and deserialize the JSON content from an API response.
 
         Parameters
         ----------
-        response : requests.Response
-            Response object from the API request.
+        content : bytes or bytearray
+            JSON content of the response.
         model : Type[BaseModel]
             Pydantic BaseModel class for deserialization and validation.
         rtype : str, optional
@@ -341,90 +698,256 @@ class UiPath(object):
         Returns
         -------
         dict or list of dict
-            Deserialized content as a dictionary (for scalar) or a list of dictionaries (for list).
+            Deserialized content as a dictionary (for scalar) or a list of dictionaries (for list). If the client does
+            not validate responses, the records are returned as sent by the API.
 
         Examples
         --------
-        >>> self._handle_response(response, MyModel, rtype="scalar")
+        >>> self._handle_response(response.content, MyModel, rtype="scalar")
         {'field1': 'value1', 'field2': 'value2'}
 
-        >>> self._handle_response(response, MyModel, rtype="list")
+        >>> self._handle_response(response.content, MyModel, rtype="list")
         [{'field1': 'value1'}, {'field1': 'value2'}]
         """
-        if rtype.lower() == "scalar":
-            # Deserialize json (scalar values)
-            content_raw = response.json()
-            # Pydantic v1 validation
-            validated = model(**content_raw)
-            # Convert to dict
-            return validated.dict()
-
-        # List of records
-        # Deserialize json
-        content_raw = response.json()["value"]
-        # Pydantic v1 validation
-        validated_list = parse_obj_as(list[model], content_raw)
-        # return [dict(data) for data in parse_obj_as(list[model], content_raw)]
-        # Convert to a list of dicts
-        return [item.dict() for item in validated_list]
+        if rtype.lower() != "scalar":
+            # List of records
+            return _load_page(content=content, model=model, validate=self._validate)[0]
 
-    # ASSETS
-    def list_assets(self, fid: str, save_as: str | None = None) -> Response:
+        if not self._validate:
+            # Deserialize json bytes without validation
+            return from_json(content)
+
+        # Deserialize and validate json bytes (scalar values)
+        validated = model.model_validate_json(content)
+        # Convert to dict
+        return validated.model_dump()
+
+    def _odata_list(
+        self,
+        path: str,
+        model: Type[BaseModel],
+        fid: str | None = None,
+        rtype: str = "list",
+        filter: str | Filter | None = None,
+        save_as: str | None = None,
+        cache: bool = False,
+    ) -> Response:
         """
-        Retrieve all assets from the UiPath Orchestrator.
+        Retrieve records from an OData endpoint of the UiPath Orchestrator.
+
+        Select the fields of `model`, optionally filter the records, send the request and deserialize the response.
+
+        With `cache`, the request is made conditional on the ETag of the previous response (If-None-Match). When the
+        server answers 304 Not Modified, the previous body is deserialized instead and returned with status 200.
 
         Parameters
         ----------
-        fid : str
-            Specify the folder ID for the organization unit.
+        path : str
+            Path of the endpoint relative to the OData base URL, e.g. "Assets" or "QueueItems(1)".
+        model : Type[BaseModel]
+            Pydantic BaseModel class for the $select clause, deserialization and validation.
+        fid : str or None, optional
+            Folder ID for the organization unit. If None, the request is not scoped to a folder.
+        rtype : str, optional
+            Specify "scalar" for a single record or "list" for a list of records. Default is "list".
+        filter : str, Filter or None, optional
+            OData filter condition. If None, do not filter.
         save_as : str or None, optional
-            Provide the file path to save the JSON content. If None, do not save the content.
+            File path to save the JSON content. If None, do not save the content. Saving bypasses the cache.
+        cache : bool, optional
+            Revalidate the previous response with its ETag instead of downloading it again. Default is False.
 
         Returns
         -------
         Response
-            Return a dataclass containing the status code and the list of assets.
+            Dataclass containing the status code and the deserialized content.
         """
-        self._logger.info(msg="Retrieving all assets.")
-
-        # Configuration
-        token = self._configuration.token
-        url_base = self._configuration.url_base
-
         # Request headers
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-            "X-UIPATH-OrganizationUnitID": fid,
-        }
+        headers = {} if fid is None else {"X-UIPATH-OrganizationUnitID": fid}
+
+        # Conditional request
+        cache_key = (path, fid, None if filter is None else str(filter))
+        cached = self._etag_cache.get(cache_key) if cache and save_as is None else None
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
 
         # Request query
-        url_query = rf"{url_base}/odata/Assets"
+        url_query = rf"{self._url_odata}/{path}"
 
         # Query parameters
-        # Pydantic v1
-        alias_list = [field.alias for field in ListAssets.__fields__.values() if field.field_info.alias is not None]
-        params = {"$select": ",".join(alias_list)}
+        params = {"$select": _select_clause(model)}
+        if filter is not None:
+            params["$filter"] = str(filter)
 
         # Request
-        response = self._session.get(url=url_query, headers=headers, params=params, verify=True)
+        response = self._request(method="GET", url=url_query, headers=headers, params=params, save_as=save_as)
 
         # Log response code
-        self._logger.info(msg=f"HTTP Status Code {response.status_code}")
+        self._logger.info("HTTP Status Code %s", response.status_code)
+
+        # Unchanged since the cached response
+        if response.status_code == 304 and cached is not None:
+            self._logger.info("Not modified, using the cached response")
+            content = self._handle_response(content=cached[1], model=model, rtype=rtype)
+            return self.Response(status_code=200, content=content)
 
         # Output
         content = None
         if response.status_code == 200:
-            self._logger.info(msg="Request successful")
+            self._logger.info("Request successful")
 
-            # Export response to json file
-            self._export_to_json(content=response.content, save_as=save_as)
+            body = self._read_content(response=response, save_as=save_as)
+
+            # Keep the body for revalidation
+            etag = response.headers.get("ETag")
+            if cache and etag is not None:
+                self._etag_cache[cache_key] = (etag, body)
 
             # Deserialize json
-            content = self._handle_response(response=response, model=ListAssets, rtype="list")
+            content = self._handle_response(content=body, model=model, rtype=rtype)
 
         return self.Response(status_code=response.status_code, content=content)
 
+    def _iter_pages(
+        self,
+        path: str,
+        model: Type[BaseModel],
+        fid: str | None = None,
+        filter: str | Filter | None = None,
+        top: int = 1000,
+    ) -> Iterator[Response]:
+        """
+        Page through an OData list endpoint with $top/$skip.
+
+        Select the fields of `model`, optionally filter the records, and request `top` records at a time ordered by Id.
+        Yield each page as soon as it is deserialized. Advance by the number of records received, so that a server
+        capping the page size below `top` is paged through correctly. Stop once the total count of the first page is
+        reached (or, if the count is unknown, after the first short page), after an empty page, or after a page whose
+        request did not succeed.
+
+        Parameters
+        ----------
+        path : str
+            Path of the list endpoint relative to the OData base URL, e.g. "Machines".
+        model : Type[BaseModel]
+            Pydantic BaseModel class for the $select clause, deserialization and validation.
+        fid : str or None, optional
+            Folder ID for the organization unit. If None, the requests are not scoped to a folder.
+        filter : str, Filter or None, optional
+            OData filter condition. If None, do not filter.
+        top : int, optional
+            Number of records per page. Default is 1000.
+
+        Yields
+        ------
+        Response
+            Dataclass containing the status code and the list of records of one page. If the request fails, the
+            content is None and no further page is requested.
+
+        Raises
+        ------
+        ValueError
+            If `top` is lower than 1.
+        """
+        if top < 1:
+            raise ValueError(f"top must be at least 1, got {top}")
+
+        # Request headers
+        headers = {} if fid is None else {"X-UIPATH-OrganizationUnitID": fid}
+
+        # Request query
+        url_query = rf"{self._url_odata}/{path}"
+
+        # Query parameters
+        params = {"$orderby": "Id", "$select": _select_clause(model)}
+        if filter is not None:
+            params["$filter"] = str(filter)
+
+        skip = 0
+        total = None
+        while True:
+            # Query parameters, with the total count on the first page
+            page_params = {**params, "$top": top, "$skip": skip}
+            if skip == 0:
+                page_params["$count"] = "true"
+
+            # Request
+            response = self._request(method="GET", url=url_query, headers=headers, params=page_params)
+
+            # Log response code
+            self._logger.info("HTTP Status Code %s", response.status_code)
+
+            if response.status_code != 200:
+                yield self.Response(status_code=response.status_code, content=None)
+                return
+
+            # Deserialize json
+            records, count = _load_page(content=response.content, model=model, validate=self._validate)
+
+            if skip == 0 and count is not None:
+                self._logger.info("%s records to retrieve", count)
+                total = count
+
+            yield self.Response(status_code=response.status_code, content=records)
+
+            skip += len(records)
+            if not records or (skip >= total if total is not None else len(records) < top):
+                return
+
+    def _fan_out(self, fn: Callable[[Any], Response], args: list, max_workers: int = 16) -> list[Response]:
+        """
+        Call `fn` once per argument over a bounded thread pool sharing the client session.
+
+        A request error raised for one argument (e.g. `requests.ReadTimeout`) does not abort the others: it is logged
+        and returned in place of that argument's response, with status code 0 and the exception as content.
+
+        Parameters
+        ----------
+        fn : Callable
+            Client method, or wrapper of one, taking a single argument and returning a Response.
+        args : list
+            Arguments to call `fn` with.
+        max_workers : int, optional
+            Maximum number of concurrent requests. Keep it at or below the connection pool size (see
+            `configure_pool`). Default is 16.
+
+        Returns
+        -------
+        list of Response
+            One response per argument, in the order of `args`.
+        """
+
+        def call(arg: Any) -> UiPath.Response:
+            try:
+                return fn(arg)
+            except requests.RequestException as exc:
+                self._logger.warning("Request failed without a response. error=%r", exc)
+                return self.Response(status_code=0, content=exc)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(call, args))
+
+    # ASSETS
+    def list_assets(self, fid: str, save_as: str | None = None) -> Response:
+        """
+        Retrieve all assets from the UiPath Orchestrator.
+
+        Parameters
+        ----------
+        fid : str
+            Specify the folder ID for the organization unit.
+        save_as : str or None, optional
+            Provide the file path to save the JSON content. If None, do not save the content.
+
+        Returns
+        -------
+        Response
+            Return a dataclass containing the status code and the list of assets.
+        """
+        self._logger.info("Retrieving all assets.")
+
+        return self._odata_list(path="Assets", model=ListAssets, fid=fid, save_as=save_as)
+
     # BUCKETS
     def list_buckets(self, fid: str, save_as: str | None = None) -> Response:
         """
@@ -445,45 +968,9 @@ class UiPath(object):
         Response
             Dataclass containing the status code and the list of buckets.
         """
-        self._logger.info(msg="Retrieving the list of all storage buckets.")
-
-        # Configuration
-        token = self._configuration.token
-        url_base = self._configuration.url_base
-
-        # Request headers
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-            "X-UIPATH-OrganizationUnitID": fid,
-        }
-
-        # Request query
-        url_query = rf"{url_base}/odata/Buckets"
-
-        # Query parameters
-        # Pydantic v1
-        alias_list = [field.alias for field in ListBuckets.__fields__.values() if field.field_info.alias is not None]
-        params = {"$select": ",".join(alias_list)}
-
-        # Request
-        response = self._session.get(url=url_query, headers=headers, params=params, verify=True)
-
-        # Log response code
-        self._logger.info(msg=f"HTTP Status Code {response.status_code}")
-
-        # Output
-        content = None
-        if response.status_code == 200:
-            self._logger.info(msg="Request successful")
-
-            # Export response to json file
-            self._export_to_json(content=response.content, save_as=save_as)
-
-            # Deserialize json
-            content = self._handle_response(response=response, model=ListBuckets, rtype="list")
+        self._logger.info("Retrieving the list of all storage buckets.")
 
-        return self.Response(status_code=response.status_code, content=content)
+        return self._odata_list(path="Buckets", model=ListBuckets, fid=fid, save_as=save_as)
 
     def create_bucket(self, fid: str, name: str, guid: str, description: str | None = None) -> Response:
         """
@@ -508,25 +995,16 @@ class UiPath(object):
         Response
             Dataclass containing the status code and the response content.
         """
-        self._logger.info(msg="Creating a new storage bucket.")
-        self._logger.info(msg=name)
-
-        # Configuration
-        token = self._configuration.token
-        url_base = self._configuration.url_base
+        self._logger.info("Creating a new storage bucket. name=%s", name)
 
         # Request headers
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-            "X-UIPATH-OrganizationUnitID": fid,
-        }
+        headers = {"X-UIPATH-OrganizationUnitID": fid}
 
         # Description
         description = "" if description is None else description
 
         # Request query
-        url_query = rf"{url_base}/odata/Buckets"
+        url_query = rf"{self._url_odata}/Buckets"
 
         # Body
         body = {
@@ -544,14 +1022,14 @@ class UiPath(object):
         }
 
         # Request
-        response = self._session.post(url=url_query, json=body, headers=headers, verify=True)
+        response = self._request(method="POST", url=url_query, data=to_json(body), headers=headers)
 
         # Log response code
-        self._logger.info(msg=f"HTTP Status Code {response.status_code}")
+        self._logger.info("HTTP Status Code %s", response.status_code)
 
         content = None
         if response.status_code == 201:
-            self._logger.info(msg="Request successful")
+            self._logger.info("Request successful")
 
         return self.Response(status_code=response.status_code, content=content)
 
@@ -571,33 +1049,24 @@ class UiPath(object):
         Response
             Dataclass containing the status code and the response content.
         """
-        self._logger.info(msg="Deleting the specified storage bucket.")
-        self._logger.info(msg=id)
-
-        # Configuration
-        token = self._configuration.token
-        url_base = self._configuration.url_base
+        self._logger.info("Deleting the specified storage bucket. id=%s", id)
 
         # Request headers
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-            "X-UIPATH-OrganizationUnitID": fid,
-        }
+        headers = {"X-UIPATH-OrganizationUnitID": fid}
 
         # Request query
-        url_query = rf"{url_base}/odata/Buckets({id})"
+        url_query = rf"{self._url_odata}/Buckets({id})"
 
         # Request
-        response = self._session.delete(url=url_query, headers=headers, verify=True)
+        response = self._request(method="DELETE", url=url_query, headers=headers)
 
         # Log response code
-        self._logger.info(msg=f"HTTP Status Code {response.status_code}")
+        self._logger.info("HTTP Status Code %s", response.status_code)
 
         # Output
         content = None
         if response.status_code == 204:
-            self._logger.info(msg="Request successful")
+            self._logger.info("Request successful")
 
         return self.Response(status_code=response.status_code, content=content)
 
@@ -624,46 +1093,41 @@ class UiPath(object):
         Response
             Dataclass containing the status code and the response content.
         """
-        self._logger.info(msg="Uploading file to the specified bucket.")
-        self._logger.info(msg=id)
-        self._logger.info(msg=localpath)
-        self._logger.info(msg=remotepath)
-
-        # Configuration
-        token = self._configuration.token
-        url_base = self._configuration.url_base
+        self._logger.info(
+            "Uploading file to the specified bucket. bucket=%s local=%s remote=%s", id, localpath, remotepath
+        )
 
         # Request headers
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-            "X-UIPATH-OrganizationUnitID": fid,
-        }
+        headers = {"X-UIPATH-OrganizationUnitID": fid}
 
         # Request query
         server_conf = "UiPath.Server.Configuration.OData"
-        url_query = rf"{url_base}/odata/Buckets({id})/{server_conf}.GetWriteUri?path={remotepath}&expiryInMinutes=0"
+        url_query = rf"{self._url_odata}/Buckets({id})/{server_conf}.GetWriteUri"
+
+        # Query parameters (encoded by requests)
+        params = {"path": remotepath, "expiryInMinutes": 0}
 
         # Request
-        response = self._session.get(url=url_query, headers=headers, verify=True)
+        response = self._request(method="GET", url=url_query, headers=headers, params=params)
 
         # Log response code
-        self._logger.info(msg=f"HTTP Status Code {response.status_code}")
+        self._logger.info("HTTP Status Code %s", response.status_code)
 
         # Output
         content = None
         if response.status_code == 200:
             # Extract URI
-            uri = response.json()["Uri"]
+            uri = from_json(response.content)["Uri"]
             # Body
             with open(file=localpath, mode="rb") as file:
                 # Upload file
-                headers = {"x-ms-blob-type": "BlockBlob"}
-                response = self._session.put(url=uri, headers=headers, data=file, verify=True)
+                # The write URI is pre-signed, do not forward the Orchestrator session headers
+                headers = {"x-ms-blob-type": "BlockBlob", "Authorization": None, "Content-Type": None}
+                response = self._request(method="PUT", url=uri, headers=headers, data=file)
 
                 # Successful upload
                 if response.status_code == 200:
-                    self._logger.info(msg="File uploaded successfully")
+                    self._logger.info("File uploaded successfully")
 
         return self.Response(status_code=response.status_code, content=content)
 
@@ -687,33 +1151,27 @@ class UiPath(object):
         Response
             Dataclass containing the status code and the response content.
         """
-        self._logger.info(msg="Deleting the specified file from the storage bucket.")
-        self._logger.info(msg=filename)
-
-        # Configuration
-        token = self._configuration.token
-        url_base = self._configuration.url_base
+        self._logger.info("Deleting the specified file from the storage bucket. filename=%s", filename)
 
         # Request headers
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-            "X-UIPATH-OrganizationUnitID": fid,
-        }
+        headers = {"X-UIPATH-OrganizationUnitID": fid}
 
         # Request query
-        url_query = rf"{url_base}/odata/Buckets({id})/UiPath.Server.Configuration.OData.DeleteFile?path={filename}"
+        url_query = rf"{self._url_odata}/Buckets({id})/UiPath.Server.Configuration.OData.DeleteFile"
+
+        # Query parameters (encoded by requests)
+        params = {"path": filename}
 
         # Request
-        response = self._session.delete(url=url_query, headers=headers, verify=True)
+        response = self._request(method="DELETE", url=url_query, headers=headers, params=params)
 
         # Log response code
-        self._logger.info(msg=f"HTTP Status Code {response.status_code}")
+        self._logger.info("HTTP Status Code %s", response.status_code)
 
         # Output
         content = None
         if response.status_code == 204:
-            self._logger.info(msg="Request successful")
+            self._logger.info("Request successful")
 
         return self.Response(status_code=response.status_code, content=content)
 
@@ -734,50 +1192,14 @@ class UiPath(object):
         Response
             Dataclass containing the status code and the list of calendars.
         """
-        self._logger.info(msg="Retrieving all calendars.")
-
-        # Configuration
-        token = self._configuration.token
-        url_base = self._configuration.url_base
-
-        # Request headers
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-            "X-UIPATH-OrganizationUnitID": fid,
-        }
+        self._logger.info("Retrieving all calendars.")
 
-        # Request query
-        url_query = rf"{url_base}/odata/Calendars"
+        return self._odata_list(path="Calendars", model=ListCalendars, fid=fid, save_as=save_as)
 
-        # Query parameters
-        # Pydantic v1
-        alias_list = [field.alias for field in ListCalendars.__fields__.values() if field.field_info.alias is not None]
-        params = {"$select": ",".join(alias_list)}
-
-        # Request
-        response = self._session.get(url=url_query, headers=headers, params=params, verify=True)
-
-        # Log response code
-        self._logger.info(msg=f"HTTP Status Code {response.status_code}")
-
-        # Output
-        content = None
-        if response.status_code == 200:
-            self._logger.info(msg="Request successful")
-
-            # Export response to json file
-            self._export_to_json(content=response.content, save_as=save_as)
-
-            # Deserialize json
-            content = self._handle_response(response=response, model=ListCalendars, rtype="list")
-
-        return self.Response(status_code=response.status_code, content=content)
-
-    # ENVIRONMENTS
-    def list_environments(self, fid: str, save_as: str | None = None) -> Response:
-        """
-        Retrieve all environments from the UiPath Orchestrator.
+    # ENVIRONMENTS
+    def list_environments(self, fid: str, save_as: str | None = None) -> Response:
+        """
+        Retrieve all environments from the UiPath Orchestrator.
 
         Parameters
         ----------
@@ -791,52 +1213,12 @@ class UiPath(object):
         Response
             Dataclass containing the status code and the list of environments.
         """
-        self._logger.info(msg="Retrieving all environments.")
-
-        # Configuration
-        token = self._configuration.token
-        url_base = self._configuration.url_base
-
-        # Request headers
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-            "X-UIPATH-OrganizationUnitID": fid,
-        }
-
-        # Request query
-        url_query = rf"{url_base}/odata/Environments"
-
-        # Query parameters
-        # Pydantic v1
-        alias_list = [
-            field.alias
-            for field in ListEnvironments.__fields__.values()
-            if field.field_info.alias is not None
-        ]
-        params = {"$select": ",".join(alias_list)}
-
-        # Request
-        response = self._session.get(url=url_query, headers=headers, params=params, verify=True)
+        self._logger.info("Retrieving all environments.")
 
-        # Log response code
-        self._logger.info(msg=f"HTTP Status Code {response.status_code}")
-
-        # Output
-        content = None
-        if response.status_code == 200:
-            self._logger.info(msg="Request successful")
-
-            # Export response to json file
-            self._export_to_json(content=response.content, save_as=save_as)
-
-            # Deserialize json
-            content = self._handle_response(response=response, model=ListEnvironments, rtype="list")
-
-        return self.Response(status_code=response.status_code, content=content)
+        return self._odata_list(path="Environments", model=ListEnvironments, fid=fid, save_as=save_as)
 
     # JOBS
-    def list_jobs(self, fid: str, filter: str, save_as: str | None = None) -> Response:
+    def list_jobs(self, fid: str, filter: str | Filter, save_as: str | None = None) -> Response:
         """
         Retrieve jobs from the UiPath Orchestrator using a filter.
 
@@ -847,7 +1229,7 @@ class UiPath(object):
         ----------
         fid : str
             Specify the folder ID for the organization unit.
-        filter : str
+        filter : str or Filter
             Provide the OData filter condition. For example, "State eq 'Running'".
         save_as : str or None, optional
             Specify the file path to save the JSON content. If None, do not save the content.
@@ -858,46 +1240,9 @@ class UiPath(object):
             Return a dataclass containing the status code and the list of jobs.
         """
 
-        self._logger.info(msg="Retrieving jobs using the provided filter criteria.")
-        self._logger.info(msg=filter)
+        self._logger.info("Retrieving jobs using the provided filter criteria. filter=%s", filter)
 
-        # Configuration
-        token = self._configuration.token
-        url_base = self._configuration.url_base
-
-        # Request headers
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-            "X-UIPATH-OrganizationUnitID": fid,
-        }
-
-        # Request query
-        url_query = rf"{url_base}/odata/Jobs"
-
-        # Query parameters
-        # Pydantic v1
-        alias_list = [field.alias for field in ListJobs.__fields__.values() if field.field_info.alias is not None]
-        params = {"$select": ",".join(alias_list), "$filter": filter}
-
-        # Request
-        response = self._session.get(url=url_query, headers=headers, params=params, verify=True)
-
-        # Log response code
-        self._logger.info(msg=f"HTTP Status Code {response.status_code}")
-
-        # Output
-        content = None
-        if response.status_code == 200:
-            self._logger.info(msg="Request successful")
-
-            # Export response to json file
-            self._export_to_json(content=response.content, save_as=save_as)
-
-            # Deserialize json
-            content = self._handle_response(response=response, model=ListJobs, rtype="list")
-
-        return self.Response(status_code=response.status_code, content=content)
+        return self._odata_list(path="Jobs", model=ListJobs, fid=fid, filter=filter, save_as=save_as)
 
     def start_job(self, fid: str, process_key: str, robot_id: int | None = None) -> Response:
         """
@@ -920,23 +1265,13 @@ class UiPath(object):
         Response
             Return a dataclass containing the status code and the response content.
         """
-        self._logger.info(msg="Initiating the process of starting a job.")
-        self._logger.info(msg=process_key)
-        self._logger.info(msg=robot_id)
-
-        # Configuration
-        token = self._configuration.token
-        url_base = self._configuration.url_base
+        self._logger.info("Initiating the process of starting a job. process_key=%s robot_id=%s", process_key, robot_id)
 
         # Request headers
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-            "X-UIPATH-OrganizationUnitID": fid,
-        }
+        headers = {"X-UIPATH-OrganizationUnitID": fid}
 
         # Request query
-        url_query = rf"{url_base}/odata/Jobs/UiPath.Server.Configuration.OData.StartJobs"
+        url_query = rf"{self._url_odata}/Jobs/UiPath.Server.Configuration.OData.StartJobs"
 
         # Body
         # case-sensitive
@@ -972,11 +1307,11 @@ class UiPath(object):
             }
 
         # Request
-        response = self._session.post(url=url_query, json=body, headers=headers, verify=True)
+        response = self._request(method="POST", url=url_query, data=to_json(body), headers=headers)
         # print(response.content)
 
         # Log response code
-        self._logger.info(msg=f"HTTP Status Code {response.status_code}")
+        self._logger.info("HTTP Status Code %s", response.status_code)
 
         return self.Response(status_code=response.status_code, content=None)
 
@@ -999,36 +1334,27 @@ class UiPath(object):
         Response
             Return a dataclass containing the status code and the response content.
         """
-        self._logger.info(msg="Stopping the specified job.")
-        self._logger.info(msg=id)
-
-        # Configuration
-        token = self._configuration.token
-        url_base = self._configuration.url_base
+        self._logger.info("Stopping the specified job. id=%s", id)
 
         # Request headers
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-            "X-UIPATH-OrganizationUnitID": fid,
-        }
+        headers = {"X-UIPATH-OrganizationUnitID": fid}
 
         # Request query
-        url_query = rf"{url_base}/odata/Jobs({id})/UiPath.Server.Configuration.OData.StopJob"
+        url_query = rf"{self._url_odata}/Jobs({id})/UiPath.Server.Configuration.OData.StopJob"
 
         # Body
         body = {"strategy": "2"}
 
         # Request
-        response = self._session.post(url=url_query, json=body, headers=headers, verify=True)
+        response = self._request(method="POST", url=url_query, data=to_json(body), headers=headers)
 
         # Log response code
-        self._logger.info(msg=f"HTTP Status Code {response.status_code}")
+        self._logger.info("HTTP Status Code %s", response.status_code)
 
         # Output
         content = None
         if response.status_code == 200:
-            self._logger.info(msg="Request successful")
+            self._logger.info("Request successful")
 
         return self.Response(status_code=response.status_code, content=content)
 
@@ -1049,45 +1375,31 @@ class UiPath(object):
         Response
             Dataclass containing the status code and the list of machines.
         """
-        self._logger.info(msg="Retrieving a list of all machines.")
-
-        # Configuration
-        token = self._configuration.token
-        url_base = self._configuration.url_base
-
-        # Request headers
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-            "X-UIPATH-OrganizationUnitID": fid,
-        }
-
-        # Request query
-        url_query = rf"{url_base}/odata/Machines"
+        self._logger.info("Retrieving a list of all machines.")
 
-        # Query parameters
-        # Pydantic v1
-        alias_list = [field.alias for field in ListMachines.__fields__.values() if field.field_info.alias is not None]
-        params = {"$select": ",".join(alias_list)}
-
-        # Request
-        response = self._session.get(url=url_query, headers=headers, params=params, verify=True)
+        return self._odata_list(path="Machines", model=ListMachines, fid=fid, save_as=save_as, cache=True)
 
-        # Log response code
-        self._logger.info(msg=f"HTTP Status Code {response.status_code}")
+    def iter_machines(self, fid: str, top: int = 1000) -> Iterator[Response]:
+        """
+        Retrieve machines from the UiPath Orchestrator page by page.
 
-        # Output
-        content = None
-        if response.status_code == 200:
-            self._logger.info(msg="Request successful")
+        Page through the results with $top/$skip so that large result sets can be processed incrementally.
 
-            # Export response to json file
-            self._export_to_json(content=response.content, save_as=save_as)
+        Parameters
+        ----------
+        fid : str
+            Specify the folder ID for the organization unit.
+        top : int, optional
+            Specify the number of records per page. Default is 1000.
 
-            # Deserialize json
-            content = self._handle_response(response=response, model=ListMachines, rtype="list")
+        Yields
+        ------
+        Response
+            Dataclass containing the status code and the list of machines of one page.
+        """
+        self._logger.info("Retrieving machines page by page.")
 
-        return self.Response(status_code=response.status_code, content=content)
+        yield from self._iter_pages(path="Machines", model=ListMachines, fid=fid, top=top)
 
     # PROCESSES
     def list_processes(self, fid: str, save_as: str | None = None) -> Response:
@@ -1106,45 +1418,31 @@ class UiPath(object):
         Response
             Dataclass containing the status code and the list of processes.
         """
-        self._logger.info(msg="Retrieving a comprehensive list of all processes.")
-
-        # Configuration
-        token = self._configuration.token
-        url_base = self._configuration.url_base
-
-        # Request headers
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-            "X-UIPATH-OrganizationUnitID": fid,
-        }
-
-        # Request query
-        url_query = rf"{url_base}/odata/Processes"
+        self._logger.info("Retrieving a comprehensive list of all processes.")
 
-        # Query parameters
-        # Pydantic v1
-        alias_list = [field.alias for field in ListProcesses.__fields__.values() if field.field_info.alias is not None]
-        params = {"$select": ",".join(alias_list)}
-
-        # Request
-        response = self._session.get(url=url_query, headers=headers, params=params, verify=True)
+        return self._odata_list(path="Processes", model=ListProcesses, fid=fid, save_as=save_as, cache=True)
 
-        # Log response code
-        self._logger.info(msg=f"HTTP Status Code {response.status_code}")
+    def iter_processes(self, fid: str, top: int = 1000) -> Iterator[Response]:
+        """
+        Retrieve processes from the UiPath Orchestrator page by page.
 
-        # Output
-        content = None
-        if response.status_code == 200:
-            self._logger.info(msg="Request successful")
+        Page through the results with $top/$skip so that large result sets can be processed incrementally.
 
-            # Export response to json file
-            self._export_to_json(content=response.content, save_as=save_as)
+        Parameters
+        ----------
+        fid : str
+            Specify the folder ID for the organization unit.
+        top : int, optional
+            Specify the number of records per page. Default is 1000.
 
-            # Deserialize json
-            content = self._handle_response(response=response, model=ListProcesses, rtype="list")
+        Yields
+        ------
+        Response
+            Dataclass containing the status code and the list of processes of one page.
+        """
+        self._logger.info("Retrieving processes page by page.")
 
-        return self.Response(status_code=response.status_code, content=content)
+        yield from self._iter_pages(path="Processes", model=ListProcesses, fid=fid, top=top)
 
     # QUEUES
     def list_queues(self, fid: str, save_as: str | None = None) -> Response:
@@ -1163,47 +1461,33 @@ class UiPath(object):
         Response
             Dataclass containing the status code and the list of queues.
         """
-        self._logger.info(msg="Retrieving a comprehensive list of all queues.")
-
-        # Configuration
-        token = self._configuration.token
-        url_base = self._configuration.url_base
-
-        # Request headers
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-            "X-UIPATH-OrganizationUnitID": fid,
-        }
+        self._logger.info("Retrieving a comprehensive list of all queues.")
 
-        # Request query
-        url_query = rf"{url_base}/odata/QueueDefinitions"
-
-        # Query parameters
-        # Pydantic v1
-        alias_list = [field.alias for field in ListQueues.__fields__.values() if field.field_info.alias is not None]
-        params = {"$select": ",".join(alias_list)}
+        return self._odata_list(path="QueueDefinitions", model=ListQueues, fid=fid, save_as=save_as, cache=True)
 
-        # Request
-        response = self._session.get(url=url_query, headers=headers, params=params, verify=True)
-
-        # Log response code
-        self._logger.info(msg=f"HTTP Status Code {response.status_code}")
+    def iter_queues(self, fid: str, top: int = 1000) -> Iterator[Response]:
+        """
+        Retrieve queues from the UiPath Orchestrator page by page.
 
-        # Output
-        content = None
-        if response.status_code == 200:
-            self._logger.info(msg="Request successful")
+        Page through the results with $top/$skip so that large result sets can be processed incrementally.
 
-            # Export response to json file
-            self._export_to_json(content=response.content, save_as=save_as)
+        Parameters
+        ----------
+        fid : str
+            Specify the folder ID for the organization unit.
+        top : int, optional
+            Specify the number of records per page. Default is 1000.
 
-            # Deserialize json
-            content = self._handle_response(response=response, model=ListQueues, rtype="list")
+        Yields
+        ------
+        Response
+            Dataclass containing the status code and the list of queues of one page.
+        """
+        self._logger.info("Retrieving queues page by page.")
 
-        return self.Response(status_code=response.status_code, content=content)
+        yield from self._iter_pages(path="QueueDefinitions", model=ListQueues, fid=fid, top=top)
 
-    def list_queue_items(self, fid: str, filter: str, save_as: str | None = None) -> Response:
+    def list_queue_items(self, fid: str, filter: str | Filter, save_as: str | None = None) -> Response:
         """
         Retrieve all queue items from the UiPath Orchestrator based on the specified filter.
 
@@ -1211,7 +1495,7 @@ class UiPath(object):
         ----------
         fid : str
             Folder ID for the organization unit.
-        filter : str
+        filter : str or Filter
             OData filter condition to select the queue and item status.
             Example: "QueueDefinitionId eq 1 and Status eq 'New'"
         save_as : str or None, optional
@@ -1222,46 +1506,33 @@ class UiPath(object):
         Response
             Dataclass containing the status code and the list of queue items.
         """
-        self._logger.info(msg="Retrieving a list of queue items using the provided filter criteria.")
-        self._logger.info(msg=filter)
+        self._logger.info("Retrieving a list of queue items using the provided filter criteria. filter=%s", filter)
 
-        # Configuration
-        token = self._configuration.token
-        url_base = self._configuration.url_base
+        return self._odata_list(path="QueueItems", model=ListQueueItems, fid=fid, filter=filter, save_as=save_as)
 
-        # Request headers
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-            "X-UIPATH-OrganizationUnitID": fid,
-        }
-
-        # Request query
-        url_query = rf"{url_base}/odata/QueueItems"
-
-        # Query parameters
-        # Pydantic v1
-        alias_list = [field.alias for field in ListQueueItems.__fields__.values() if field.field_info.alias is not None]
-        params = {"$select": ",".join(alias_list), "$filter": filter}
-
-        # Request
-        response = self._session.get(url=url_query, headers=headers, params=params, verify=True)
+    def iter_queue_items(self, fid: str, filter: str | Filter, top: int = 1000) -> Iterator[Response]:
+        """
+        Retrieve queue items from the UiPath Orchestrator page by page.
 
-        # Log response code
-        self._logger.info(msg=f"HTTP Status Code {response.status_code}")
+        Page through the results with $top/$skip so that large result sets can be processed incrementally.
 
-        # Output
-        content = None
-        if response.status_code == 200:
-            self._logger.info(msg="Request successful")
-
-            # Export response to json file
-            self._export_to_json(content=response.content, save_as=save_as)
+        Parameters
+        ----------
+        fid : str
+            Specify the folder ID for the organization unit.
+        filter : str or Filter
+            Provide the OData filter condition. For example, "Status eq 'New'".
+        top : int, optional
+            Specify the number of records per page. Default is 1000.
 
-            # Deserialize json
-            content = self._handle_response(response=response, model=ListQueueItems, rtype="list")
+        Yields
+        ------
+        Response
+            Dataclass containing the status code and the list of queue items of one page.
+        """
+        self._logger.info("Retrieving queue items page by page.")
 
-        return self.Response(status_code=response.status_code, content=content)
+        yield from self._iter_pages(path="QueueItems", model=ListQueueItems, fid=fid, filter=filter, top=top)
 
     def get_queue_item(self, fid: str, id: int, save_as: str | None = None) -> Response:
         """
@@ -1281,46 +1552,9 @@ class UiPath(object):
         Response
             Dataclass containing the status code and the details of the queue item.
         """
-        self._logger.info(msg="Retrieving details for the specified queue item from the queue.")
-        self._logger.info(msg=id)
+        self._logger.info("Retrieving details for the specified queue item from the queue. id=%s", id)
 
-        # Configuration
-        token = self._configuration.token
-        url_base = self._configuration.url_base
-
-        # Request headers
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-            "X-UIPATH-OrganizationUnitID": fid,
-        }
-
-        # Request query
-        url_query = rf"{url_base}/odata/QueueItems({id})"
-
-        # Query parameters
-        # Pydantic v1
-        alias_list = [field.alias for field in GetQueueItem.__fields__.values() if field.field_info.alias is not None]
-        params = {"$select": ",".join(alias_list)}
-
-        # Request
-        response = self._session.get(url=url_query, headers=headers, params=params, verify=True)
-
-        # Log response code
-        self._logger.info(msg=f"HTTP Status Code {response.status_code}")
-
-        # Output
-        content = None
-        if response.status_code == 200:
-            self._logger.info(msg="Request successful")
-
-            # Export response to json file
-            self._export_to_json(content=response.content, save_as=save_as)
-
-            # Deserialize json
-            content = self._handle_response(response=response, model=GetQueueItem, rtype="scalar")
-
-        return self.Response(status_code=response.status_code, content=content)
+        return self._odata_list(path=f"QueueItems({id})", model=GetQueueItem, fid=fid, rtype="scalar", save_as=save_as)
 
     def add_queue_item(
         self,
@@ -1358,28 +1592,16 @@ class UiPath(object):
         Response
             Dataclass containing the status code and the response content.
         """
-        self._logger.info(msg="Adding an item to the queue.")
-        self._logger.info(msg=queue)
-        self._logger.info(msg=reference)
-
-        # Configuration
-        token = self._configuration.token
-        url_base = self._configuration.url_base
+        self._logger.info("Adding an item to the queue. queue=%s reference=%s", queue, reference)
 
         # Request headers
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-            "X-UIPATH-OrganizationUnitID": fid,
-        }
+        headers = {"X-UIPATH-OrganizationUnitID": fid}
 
         # Request query
-        url_query = rf"{url_base}/odata/Queues/UiPathODataSvc.AddQueueItem"
+        url_query = rf"{self._url_odata}/Queues/UiPathODataSvc.AddQueueItem"
 
         # Query parameters
-        # Pydantic v1
-        alias_list = [field.alias for field in AddQueueItem.__fields__.values() if field.field_info.alias is not None]
-        params = {"$select": ",".join(alias_list)}
+        params = {"$select": _select_clause(AddQueueItem)}
 
         # Body
         # DueDate: null -> DueDate: None
@@ -1395,29 +1617,168 @@ class UiPath(object):
         }
 
         # Request
-        # .encode("utf-8")
-        response = self._session.post(url=url_query, json=body, headers=headers, params=params, verify=True)
+        # Body serialized to UTF-8 JSON bytes by pydantic-core
+        response = self._request(
+            method="POST",
+            url=url_query,
+            data=to_json(body),
+            headers=headers,
+            params=params,
+            save_as=save_as,
+        )
 
         # Log response code
-        self._logger.info(msg=f"HTTP Status Code {response.status_code}")
+        self._logger.info("HTTP Status Code %s", response.status_code)
 
         # Unique reference violation
         if response.status_code == 409:
-            self._logger.warning(f"Item with reference {reference} already in the queue")
+            self._logger.warning("Item with reference %s already in the queue", reference)
 
         # Output
         content = None
         if response.status_code == 201:
-            self._logger.info(msg="Request successful")
-
-            # Export response to json file
-            self._export_to_json(content=response.content, save_as=save_as)
+            self._logger.info("Request successful")
 
             # Deserialize json
-            content = self._handle_response(response=response, model=AddQueueItem, rtype="scalar")
+            body = self._read_content(response=response, save_as=save_as)
+            content = self._handle_response(content=body, model=AddQueueItem, rtype="scalar")
 
         return self.Response(status_code=response.status_code, content=content)
 
+    def bulk_add_queue_items(
+        self,
+        fid: str,
+        queue: str,
+        items: list[dict],
+        commit_type: str = "ProcessAllIndependently",
+        batch_size: int = 100,
+    ) -> Response:
+        """
+        Add several items to a UiPath Orchestrator queue with one request per batch.
+
+        Insert the items into the specified queue within the given organization unit (folder) using the
+        BulkAddQueueItems endpoint, sending at most `batch_size` items per request.
+
+        Parameters
+        ----------
+        fid : str
+            Specify the folder ID for the organization unit.
+        queue : str
+            Specify the name of the queue.
+        items : list of dict
+            Provide the items to add. Each item holds its "data" dictionary, its unique "reference" and, optionally,
+            its "priority" (default "Normal").
+        commit_type : str, optional
+            Set how each batch is committed: "AllOrNothing", "StopOnFirstFailure" or "ProcessAllIndependently".
+            Default is "ProcessAllIndependently".
+        batch_size : int, optional
+            Set the maximum number of items sent per request. Default is 100.
+
+        Returns
+        -------
+        Response
+            Dataclass containing the status code and a dictionary with "submitted", the number of items sent in
+            batches that Orchestrator accepted, and "failed", the items of those batches it rejected.
+
+        Notes
+        -----
+        The commit type applies to each batch separately. If a batch request fails, the remaining batches are not sent
+        and the status code of the failed request is returned. The batches before it are committed: `items[:submitted]`
+        were processed (except the "failed" ones), while `items[submitted:]`, starting with the failed batch, were not
+        confirmed and can be resent.
+        """
+        self._logger.info("Adding items to the queue in bulk. queue=%s items=%s", queue, len(items))
+
+        # Request headers
+        headers = {"X-UIPATH-OrganizationUnitID": fid}
+
+        # Request query
+        url_query = rf"{self._url_odata}/Queues/UiPathODataSvc.BulkAddQueueItems"
+
+        # Output
+        failed = []
+        for start in range(0, len(items), batch_size):
+            # Body
+            body = {
+                "commitType": commit_type,
+                "queueName": queue,
+                "queueItems": [
+                    {
+                        "Name": queue,
+                        "Priority": item.get("priority", "Normal"),  # Normal, High
+                        "DeferDate": None,
+                        "DueDate": None,
+                        "Reference": item["reference"],
+                        "SpecificContent": item["data"],
+                    }
+                    for item in items[start : start + batch_size]
+                ],
+            }
+
+            # Request
+            response = self._request(method="POST", url=url_query, data=to_json(body), headers=headers)
+
+            # Log response code
+            self._logger.info("HTTP Status Code %s", response.status_code)
+
+            if response.status_code != 200:
+                self._logger.warning("Batch request failed after %s items. status=%s", start, response.status_code)
+                return self.Response(status_code=response.status_code, content={"submitted": start, "failed": failed})
+
+            # Items rejected by Orchestrator
+            failed.extend(from_json(response.content).get("value", []))
+
+        if failed:
+            self._logger.warning("%s items could not be added to the queue", len(failed))
+
+        return self.Response(status_code=200, content={"submitted": len(items), "failed": failed})
+
+    def map_add_queue_items(self, fid: str, queue: str, items: list[dict], max_workers: int = 16) -> list[Response]:
+        """
+        Add several items to a UiPath Orchestrator queue with concurrent `add_queue_item` calls.
+
+        Fan the items out over a bounded thread pool sharing the client session. Each item gets its own response, so
+        individual failures do not affect the other items: an HTTP error (e.g. 409 for a duplicate reference) is
+        returned with its status code, and a request error (e.g. a timeout) with status code 0 and the exception as
+        content.
+
+        Parameters
+        ----------
+        fid : str
+            Specify the folder ID for the organization unit.
+        queue : str
+            Specify the name of the queue.
+        items : list of dict
+            Provide the items to add. Each item holds its "data" dictionary, its unique "reference" and, optionally,
+            its "priority" (default "Normal").
+        max_workers : int, optional
+            Set the maximum number of concurrent requests. Keep it at or below the connection pool size (see
+            `configure_pool`). Default is 16.
+
+        Returns
+        -------
+        list of Response
+            One response per item, in the order of `items`.
+
+        Notes
+        -----
+        An item whose response has status code 0 may or may not have been added, e.g. when the read timed out after
+        Orchestrator received the request. Check its reference before resending it, unless the queue enforces unique
+        references, in which case a duplicate is rejected with 409.
+        """
+        self._logger.info("Adding items to the queue concurrently. queue=%s items=%s", queue, len(items))
+
+        def add(item: dict) -> UiPath.Response:
+            return self.add_queue_item(
+                fid=fid,
+                queue=queue,
+                data=item["data"],
+                reference=item["reference"],
+                priority=item.get("priority", "Normal"),
+            )
+
+        return self._fan_out(add, items, max_workers)
+
     def update_queue_item(self, fid: str, queue: str, id: int, data: dict) -> Response:
         """
         Update an item in a UiPath Orchestrator queue.
@@ -1443,22 +1804,13 @@ class UiPath(object):
         Response
             Dataclass containing the status code and the response content.
         """
-        self._logger.info(msg="Updating a queue item in the queue.")
-        self._logger.info(msg=queue)
-
-        # Configuration
-        token = self._configuration.token
-        url_base = self._configuration.url_base
+        self._logger.info("Updating a queue item in the queue. queue=%s", queue)
 
         # Request headers
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-            "X-UIPATH-OrganizationUnitID": fid,
-        }
+        headers = {"X-UIPATH-OrganizationUnitID": fid}
 
         # Request query
-        url_query = rf"{url_base}/odata/QueueItems({id})"
+        url_query = rf"{self._url_odata}/QueueItems({id})"
 
         # Body
         body = {
@@ -1471,17 +1823,16 @@ class UiPath(object):
         }
 
         # Request
-        # do not remove encode: data=body.encode("utf-8")
-        # test in the future the body: dict and data=json.dumps(body)
-        response = self._session.put(url=url_query, json=body, headers=headers, verify=True)
+        # Body serialized to UTF-8 JSON bytes by pydantic-core
+        response = self._request(method="PUT", url=url_query, data=to_json(body), headers=headers)
 
         # Log response code
-        self._logger.info(msg=f"HTTP Status Code {response.status_code}")
+        self._logger.info("HTTP Status Code %s", response.status_code)
 
         # Output
         content = None
         if response.status_code == 200:
-            self._logger.info(msg="Request successful")
+            self._logger.info("Request successful")
 
         return self.Response(status_code=response.status_code, content=content)
 
@@ -1504,33 +1855,24 @@ class UiPath(object):
         Response
             Dataclass containing the status code and the response content.
         """
-        self._logger.info(msg="Deleting the specified queue item from the queue.")
-        self._logger.info(msg=id)
-
-        # Configuration
-        token = self._configuration.token
-        url_base = self._configuration.url_base
+        self._logger.info("Deleting the specified queue item from the queue. id=%s", id)
 
         # Request headers
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-            "X-UIPATH-OrganizationUnitID": fid,
-        }
+        headers = {"X-UIPATH-OrganizationUnitID": fid}
 
         # Request query
-        url_query = rf"{url_base}/odata/QueueItems({id})"
+        url_query = rf"{self._url_odata}/QueueItems({id})"
 
         # Request
-        response = self._session.delete(url=url_query, headers=headers, verify=True)
+        response = self._request(method="DELETE", url=url_query, headers=headers)
 
         # Log response code
-        self._logger.info(msg=f"HTTP Status Code {response.status_code}")
+        self._logger.info("HTTP Status Code %s", response.status_code)
 
         # Output
         content = None
         if response.status_code == 204:
-            self._logger.info(msg="Request successful")
+            self._logger.info("Request successful")
 
         return self.Response(status_code=response.status_code, content=content)
 
@@ -1551,45 +1893,31 @@ class UiPath(object):
         Response
             Dataclass containing the status code and the list of releases.
         """
-        self._logger.info(msg="Retrieving the list of all process releases.")
-
-        # Configuration
-        token = self._configuration.token
-        url_base = self._configuration.url_base
+        self._logger.info("Retrieving the list of all process releases.")
 
-        # Request headers
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-            "X-UIPATH-OrganizationUnitID": fid,
-        }
-
-        # Request query
-        url_query = rf"{url_base}/odata/Releases"
+        return self._odata_list(path="Releases", model=ListReleases, fid=fid, save_as=save_as, cache=True)
 
-        # Query parameters
-        # Pydantic v1
-        alias_list = [field.alias for field in ListReleases.__fields__.values() if field.field_info.alias is not None]
-        params = {"$select": ",".join(alias_list)}
-
-        # Request
-        response = self._session.get(url=url_query, headers=headers, params=params, verify=True)
+    def iter_releases(self, fid: str, top: int = 1000) -> Iterator[Response]:
+        """
+        Retrieve process releases from the UiPath Orchestrator page by page.
 
-        # Log response code
-        self._logger.info(msg=f"HTTP Status Code {response.status_code}")
+        Page through the results with $top/$skip so that large result sets can be processed incrementally.
 
-        # Output
-        content = None
-        if response.status_code == 200:
-            self._logger.info(msg="Request successful")
-
-            # Export response to json file
-            self._export_to_json(content=response.content, save_as=save_as)
+        Parameters
+        ----------
+        fid : str
+            Specify the folder ID for the organization unit.
+        top : int, optional
+            Specify the number of records per page. Default is 1000.
 
-            # Deserialize json
-            content = self._handle_response(response=response, model=ListReleases, rtype="list")
+        Yields
+        ------
+        Response
+            Dataclass containing the status code and the list of process releases of one page.
+        """
+        self._logger.info("Retrieving process releases page by page.")
 
-        return self.Response(status_code=response.status_code, content=content)
+        yield from self._iter_pages(path="Releases", model=ListReleases, fid=fid, top=top)
 
     # ROBOTS
     def list_robots(self, fid: str, save_as: str | None = None) -> Response:
@@ -1608,47 +1936,33 @@ class UiPath(object):
         Response
             Dataclass containing the status code and the list of robots.
         """
-        self._logger.info(msg="Retrieving a comprehensive list of all robots.")
+        self._logger.info("Retrieving a comprehensive list of all robots.")
 
-        # Configuration
-        token = self._configuration.token
-        url_base = self._configuration.url_base
+        return self._odata_list(path="Robots", model=ListRobots, fid=fid, save_as=save_as, cache=True)
 
-        # Request headers
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-            "X-UIPATH-OrganizationUnitID": fid,
-        }
-
-        # Request query
-        url_query = rf"{url_base}/odata/Robots"
-
-        # Query parameters
-        # Pydantic v1
-        alias_list = [field.alias for field in ListRobots.__fields__.values() if field.field_info.alias is not None]
-        params = {"$select": ",".join(alias_list)}
-
-        # Request
-        response = self._session.get(url=url_query, headers=headers, params=params, verify=True)
-
-        # Log response code
-        self._logger.info(msg=f"HTTP Status Code {response.status_code}")
+    def iter_robots(self, fid: str, top: int = 1000) -> Iterator[Response]:
+        """
+        Retrieve robots from the UiPath Orchestrator page by page.
 
-        # Output
-        content = None
-        if response.status_code == 200:
-            self._logger.info(msg="Request successful")
+        Page through the results with $top/$skip so that large result sets can be processed incrementally.
 
-            # Export response to json file
-            self._export_to_json(content=response.content, save_as=save_as)
+        Parameters
+        ----------
+        fid : str
+            Specify the folder ID for the organization unit.
+        top : int, optional
+            Specify the number of records per page. Default is 1000.
 
-            # Deserialize json
-            content = self._handle_response(response=response, model=ListRobots, rtype="list")
+        Yields
+        ------
+        Response
+            Dataclass containing the status code and the list of robots of one page.
+        """
+        self._logger.info("Retrieving robots page by page.")
 
-        return self.Response(status_code=response.status_code, content=content)
+        yield from self._iter_pages(path="Robots", model=ListRobots, fid=fid, top=top)
 
-    def list_robot_logs(self, fid: str, filter: str, save_as: str | None = None) -> Response:
+    def list_robot_logs(self, fid: str, filter: str | Filter, save_as: str | None = None) -> Response:
         """
         Retrieve robot logs from the UiPath Orchestrator.
 
@@ -1659,7 +1973,7 @@ class UiPath(object):
         ----------
         fid : str
             Specify the folder ID for the organization unit.
-        filter : str
+        filter : str or Filter
             Provide the OData filter condition. For example, "JobKey eq 'bde11c1e-11e1-1bb1-11d1-e11f111111db'".
         save_as : str or None, optional
             Specify the file path to save the JSON content. If None, do not save the content.
@@ -1669,24 +1983,9 @@ class UiPath(object):
         Response
             Dataclass containing the status code and the list of robot logs.
         """
-        self._logger.info(msg="Retrieving robot logs based on the provided filter criteria.")
+        self._logger.info("Retrieving robot logs based on the provided filter criteria.")
 
-        # Configuration
-        token = self._configuration.token
-        url_base = self._configuration.url_base
-
-        # Request headers
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-            "X-UIPATH-OrganizationUnitID": fid,
-        }
-
-        # Request query
-        url_query = rf"{url_base}/odata/RobotLogs"
-
-        # Query parameters
-        # Pydantic v1
+        # Query parameters (filter examples)
         # ?$top=10
         # last log line for robot X
         #   ?$top=1&$filter=RobotName eq 'Porto_Prod_2'&$orderby=TimeStamp desc
@@ -1694,27 +1993,32 @@ class UiPath(object):
         # ?$filter=Level eq UiPath.Core.Enums.LogLevel%27Fatal%27
         # ?$filter=TimeStamp gt 2021-10-12T00:00:00.000Z and Level eq 'Error' or Level eq 'Fatal'
         # ?$filter=JobKey eq 98f59394-45e7-4da6-a695-50c70f4d87e3
-        alias_list = [field.alias for field in ListRobotLogs.__fields__.values() if field.field_info.alias is not None]
-        params = {"$select": ",".join(alias_list), "$filter": filter}
 
-        # Request
-        response = self._session.get(url=url_query, headers=headers, params=params, verify=True)
+        return self._odata_list(path="RobotLogs", model=ListRobotLogs, fid=fid, filter=filter, save_as=save_as)
 
-        # Log response code
-        self._logger.info(msg=f"HTTP Status Code {response.status_code}")
+    def iter_robot_logs(self, fid: str, filter: str | Filter, top: int = 1000) -> Iterator[Response]:
+        """
+        Retrieve robot logs from the UiPath Orchestrator page by page.
 
-        # Output
-        content = None
-        if response.status_code == 200:
-            self._logger.info(msg="Request successful")
+        Page through the results with $top/$skip so that large result sets can be processed incrementally.
 
-            # Export response to json file
-            self._export_to_json(content=response.content, save_as=save_as)
+        Parameters
+        ----------
+        fid : str
+            Specify the folder ID for the organization unit.
+        filter : str or Filter
+            Provide the OData filter condition. For example, "JobKey eq 'bde11c1e-11e1-1bb1-11d1-e11f111111db'".
+        top : int, optional
+            Specify the number of records per page. Default is 1000.
 
-            # Deserialize json
-            content = self._handle_response(response=response, model=ListRobotLogs, rtype="list")
+        Yields
+        ------
+        Response
+            Dataclass containing the status code and the list of robot logs of one page.
+        """
+        self._logger.info("Retrieving robot logs page by page.")
 
-        return self.Response(status_code=response.status_code, content=content)
+        yield from self._iter_pages(path="RobotLogs", model=ListRobotLogs, fid=fid, filter=filter, top=top)
 
     # ROLES
     def list_roles(self, save_as: str | None = None) -> Response:
@@ -1734,45 +2038,9 @@ class UiPath(object):
         Response
             Dataclass containing the status code and the list of roles.
         """
-        self._logger.info(msg="Retrieving a comprehensive list of all roles.")
+        self._logger.info("Retrieving a comprehensive list of all roles.")
 
-        # Configuration
-        token = self._configuration.token
-        url_base = self._configuration.url_base
-
-        # Request headers
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-        }
-
-        # Request query
-        url_query = rf"{url_base}/odata/Roles"
-
-        # Query parameters
-        # Pydantic v1
-        alias_list = [field.alias for field in ListRoles.__fields__.values() if field.field_info.alias is not None]
-        params = {"$select": ",".join(alias_list)}
-
-        # Request
-        response = self._session.get(url=url_query, headers=headers, params=params, verify=True)
-        # print(response.content)
-
-        # Log response code
-        self._logger.info(msg=f"HTTP Status Code {response.status_code}")
-
-        # Output
-        content = None
-        if response.status_code == 200:
-            self._logger.info(msg="Request successful")
-
-            # Export response to json file
-            self._export_to_json(content=response.content, save_as=save_as)
-
-            # Deserialize json
-            content = self._handle_response(response=response, model=ListRoles, rtype="list")
-
-        return self.Response(status_code=response.status_code, content=content)
+        return self._odata_list(path="Roles", model=ListRoles, save_as=save_as, cache=True)
 
     # SCHEDULES
     def list_schedules(self, fid: str, save_as: str | None = None) -> Response:
@@ -1791,45 +2059,53 @@ class UiPath(object):
         Response
             Dataclass containing the status code and the list of schedules.
         """
-        self._logger.info(msg="Retrieving a comprehensive list of all schedules.")
+        self._logger.info("Retrieving a comprehensive list of all schedules.")
 
-        # Configuration
-        token = self._configuration.token
-        url_base = self._configuration.url_base
+        return self._odata_list(path="ProcessSchedules", model=ListSchedules, fid=fid, save_as=save_as, cache=True)
 
-        # Request headers
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-            "X-UIPATH-OrganizationUnitID": fid,
-        }
+    def iter_schedules(self, fid: str, top: int = 1000) -> Iterator[Response]:
+        """
+        Retrieve schedules from the UiPath Orchestrator page by page.
 
-        # Request query
-        url_query = rf"{url_base}/odata/ProcessSchedules"
+        Page through the results with $top/$skip so that large result sets can be processed incrementally.
 
-        # Query parameters
-        # Pydantic v1
-        alias_list = [field.alias for field in ListSchedules.__fields__.values() if field.field_info.alias is not None]
-        params = {"$select": ",".join(alias_list)}
+        Parameters
+        ----------
+        fid : str
+            Specify the folder ID for the organization unit.
+        top : int, optional
+            Specify the number of records per page. Default is 1000.
 
-        # Request
-        response = self._session.get(url=url_query, headers=headers, params=params, verify=True)
+        Yields
+        ------
+        Response
+            Dataclass containing the status code and the list of schedules of one page.
+        """
+        self._logger.info("Retrieving schedules page by page.")
 
-        # Log response code
-        self._logger.info(msg=f"HTTP Status Code {response.status_code}")
+        yield from self._iter_pages(path="ProcessSchedules", model=ListSchedules, fid=fid, top=top)
 
-        # Output
-        content = None
-        if response.status_code == 200:
-            self._logger.info(msg="Request successful")
+    def list_schedules_many(self, fids: list[str], max_workers: int = 16) -> list[Response]:
+        """
+        Retrieve all schedules from several folders of the UiPath Orchestrator with concurrent `list_schedules` calls.
 
-            # Export response to json file
-            self._export_to_json(content=response.content, save_as=save_as)
+        Fan the folders out over a bounded thread pool sharing the client session, so the round trips overlap instead
+        of running one after the other.
 
-            # Deserialize json
-            content = self._handle_response(response=response, model=ListSchedules, rtype="list")
+        Parameters
+        ----------
+        fids : list of str
+            Specify the folder IDs for the organization units.
+        max_workers : int, optional
+            Set the maximum number of concurrent requests. Keep it at or below the connection pool size (see
+            `configure_pool`). Default is 16.
 
-        return self.Response(status_code=response.status_code, content=content)
+        Returns
+        -------
+        list of Response
+            One response per folder, in the order of `fids`.
+        """
+        return self._fan_out(self.list_schedules, fids, max_workers)
 
     # SESSIONS
     def list_sessions(self, fid: str, save_as: str | None = None) -> Response:
@@ -1851,45 +2127,53 @@ class UiPath(object):
         Response
             Dataclass containing the status code and the list of sessions.
         """
-        self._logger.info(msg="Retrieving a comprehensive list of all active sessions.")
+        self._logger.info("Retrieving a comprehensive list of all active sessions.")
 
-        # Configuration
-        token = self._configuration.token
-        url_base = self._configuration.url_base
+        return self._odata_list(path="Sessions", model=ListSessions, fid=fid, save_as=save_as, cache=True)
 
-        # Request headers
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-            "X-UIPATH-OrganizationUnitID": fid,
-        }
+    def iter_sessions(self, fid: str, top: int = 1000) -> Iterator[Response]:
+        """
+        Retrieve sessions from the UiPath Orchestrator page by page.
 
-        # Request query
-        url_query = rf"{url_base}/odata/Sessions"
+        Page through the results with $top/$skip so that large result sets can be processed incrementally.
 
-        # Query parameters
-        # Pydantic v1
-        alias_list = [field.alias for field in ListSessions.__fields__.values() if field.field_info.alias is not None]
-        params = {"$select": ",".join(alias_list)}
+        Parameters
+        ----------
+        fid : str
+            Specify the folder ID for the organization unit.
+        top : int, optional
+            Specify the number of records per page. Default is 1000.
 
-        # Request
-        response = self._session.get(url=url_query, headers=headers, params=params, verify=True)
+        Yields
+        ------
+        Response
+            Dataclass containing the status code and the list of sessions of one page.
+        """
+        self._logger.info("Retrieving sessions page by page.")
 
-        # Log response code
-        self._logger.info(msg=f"HTTP Status Code {response.status_code}")
+        yield from self._iter_pages(path="Sessions", model=ListSessions, fid=fid, top=top)
 
-        # Output
-        content = None
-        if response.status_code == 200:
-            self._logger.info(msg="Request successful")
+    def list_sessions_many(self, fids: list[str], max_workers: int = 16) -> list[Response]:
+        """
+        Retrieve all sessions from several folders of the UiPath Orchestrator with concurrent `list_sessions` calls.
 
-            # Export response to json file
-            self._export_to_json(content=response.content, save_as=save_as)
+        Fan the folders out over a bounded thread pool sharing the client session, so the round trips overlap instead
+        of running one after the other.
 
-            # Deserialize json
-            content = self._handle_response(response=response, model=ListSessions, rtype="list")
+        Parameters
+        ----------
+        fids : list of str
+            Specify the folder IDs for the organization units.
+        max_workers : int, optional
+            Set the maximum number of concurrent requests. Keep it at or below the connection pool size (see
+            `configure_pool`). Default is 16.
 
-        return self.Response(status_code=response.status_code, content=content)
+        Returns
+        -------
+        list of Response
+            One response per folder, in the order of `fids`.
+        """
+        return self._fan_out(self.list_sessions, fids, max_workers)
 
 
 # eof
@@ -0,0 +1,61 @@
+"""Unit tests for the OData filter builder of the pure-Python client."""
+
+import datetime
+import unittest
+
+from old_python_version.odata import Filter
+
+
+class FilterLiteralTests(unittest.TestCase):
+    """Validate the rendering of Python values as OData literals."""
+
+    def test_string_quotes_are_escaped(self):
+        self.assertEqual(str(Filter.eq("Reference", "O'Brien")), "Reference eq 'O''Brien'")
+
+    def test_none_and_bool(self):
+        self.assertEqual(str(Filter.eq("Description", None)), "Description eq null")
+        self.assertEqual(str(Filter.ne("Enabled", True)), "Enabled ne true")
+        self.assertEqual(str(Filter.eq("Enabled", False)), "Enabled eq false")
+
+    def test_numbers(self):
+        self.assertEqual(str(Filter.gt("Id", 42)), "Id gt 42")
+        self.assertEqual(str(Filter.le("Progress", 0.5)), "Progress le 0.5")
+
+    def test_non_finite_floats(self):
+        self.assertEqual(str(Filter.eq("Value", float("nan"))), "Value eq NaN")
+        self.assertEqual(str(Filter.lt("Value", float("inf"))), "Value lt INF")
+        self.assertEqual(str(Filter.gt("Value", float("-inf"))), "Value gt -INF")
+
+    def test_naive_datetime_is_utc(self):
+        value = datetime.datetime(2024, 1, 1, 12, 30)
+        self.assertEqual(str(Filter.ge("TimeStamp", value)), "TimeStamp ge 2024-01-01T12:30:00+00:00")
+
+    def test_aware_datetime_keeps_offset(self):
+        value = datetime.datetime(2024, 1, 1, 12, 30, tzinfo=datetime.timezone(datetime.timedelta(hours=2)))
+        self.assertEqual(str(Filter.lt("TimeStamp", value)), "TimeStamp lt 2024-01-01T12:30:00+02:00")
+
+    def test_unsupported_type_raises(self):
+        with self.assertRaises(TypeError):
+            Filter.eq("Data", {"a": 1})
+
+
+class FilterCompositionTests(unittest.TestCase):
+    """Validate the composition of filters."""
+
+    def test_and_or_operators(self):
+        status = Filter.eq("Status", "New")
+        queue = Filter.eq("QueueDefinitionId", 1)
+        self.assertEqual(str(status & queue), "(Status eq 'New') and (QueueDefinitionId eq 1)")
+        self.assertEqual(str(status | queue), "(Status eq 'New') or (QueueDefinitionId eq 1)")
+
+    def test_nested_composition_and_strings(self):
+        combined = Filter.eq("Status", "New").and_(Filter.gt("Id", 3).or_("Id eq 1"))
+        self.assertEqual(str(combined), "(Status eq 'New') and ((Id gt 3) or (Id eq 1))")
+
+    def test_equality_and_hash(self):
+        self.assertEqual(Filter.eq("Id", 1), Filter("Id eq 1"))
+        self.assertEqual(len({Filter.eq("Id", 1), Filter("Id eq 1")}), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
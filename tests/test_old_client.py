@@ -0,0 +1,143 @@
+"""Unit tests for the request handling of the pure-Python client, with the HTTP transport faked."""
+
+import io
+import json
+import unittest
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from old_python_version import UiPath
+
+URL_BASE = "https://cloud.uipath.com/org/tenant/orchestrator_"
+
+
+def _machine(id):
+    return {"Id": id, "Name": f"machine-{id}", "Type": "Standard", "NonProductionSlots": 0, "UnattendedSlots": 1}
+
+
+class FakeTransport:
+    """Answer the requests sent through HTTPAdapter.send and record them."""
+
+    def __init__(self):
+        self.requests = []
+        self.routes = {}
+
+    def route(self, method, segment, handler):
+        self.routes[(method, segment)] = handler
+
+    def send(self, adapter, request, **kwargs):
+        self.requests.append(request)
+        segment = urlsplit(request.url).path.rsplit("/", 1)[-1]
+        if segment == "token":
+            status, body, headers = 200, {"access_token": "token"}, {}
+        else:
+            status, body, headers = self.routes[(request.method, segment)](request)
+
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.status_code = status
+        response.headers.update(headers)
+        response.raw = io.BytesIO(b"" if body is None else json.dumps(body).encode())
+        return response
+
+    def sent(self, method, segment):
+        return [r for r in self.requests if r.method == method and urlsplit(r.url).path.endswith("/" + segment)]
+
+
+class ClientTestCase(unittest.TestCase):
+    """Create a client whose HTTP transport is faked."""
+
+    def setUp(self):
+        self.transport = FakeTransport()
+        patcher = mock.patch.object(HTTPAdapter, "send", autospec=True, side_effect=self.transport.send)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        sleep = mock.patch("old_python_version.uipath.time.sleep")
+        self.sleep = sleep.start()
+        self.addCleanup(sleep.stop)
+
+        self.client = UiPath(url_base=URL_BASE, client_id="id", refresh_token="secret", scope="scope")
+        self.addCleanup(self.client.close)
+
+
+class IterPagesTests(ClientTestCase):
+    """Validate the $top/$skip paging of the iter_* methods."""
+
+    def test_server_capped_pages_follow_the_count(self):
+        def machines(request):
+            query = parse_qs(urlsplit(request.url).query)
+            skip = int(query["$skip"][0])
+            body = {"value": [_machine(id) for id in range(skip, min(skip + 3, 7))]}
+            if "$count" in query:
+                body["@odata.count"] = 7
+            return 200, body, {}
+
+        self.transport.route("GET", "Machines", machines)
+
+        pages = list(self.client.iter_machines(fid="1", top=10))
+
+        self.assertEqual([len(page.content) for page in pages], [3, 3, 1])
+        self.assertEqual([page.content[0]["id"] for page in pages], [0, 3, 6])
+        self.assertEqual(len(self.transport.sent("GET", "Machines")), 3)
+
+    def test_short_page_stops_without_count(self):
+        self.transport.route("GET", "Machines", lambda request: (200, {"value": [_machine(1)]}, {}))
+
+        pages = list(self.client.iter_machines(fid="1", top=5))
+
+        self.assertEqual(len(pages), 1)
+        self.assertEqual(len(self.transport.sent("GET", "Machines")), 1)
+
+    def test_top_below_one_raises(self):
+        with self.assertRaises(ValueError):
+            list(self.client.iter_machines(fid="1", top=0))
+
+        self.assertEqual(self.transport.sent("GET", "Machines"), [])
+
+
+class ETagCacheTests(ClientTestCase):
+    """Validate the If-None-Match revalidation of the cached list endpoints."""
+
+    def test_not_modified_is_served_from_the_cache(self):
+        self.transport.route("GET", "Machines", lambda request: (200, {"value": [_machine(1)]}, {"ETag": 'W/"1"'}))
+        first = self.client.list_machines(fid="1")
+
+        self.transport.route("GET", "Machines", lambda request: (304, None, {}))
+        second = self.client.list_machines(fid="1")
+
+        self.assertEqual(second, first)
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(self.transport.sent("GET", "Machines")[-1].headers["If-None-Match"], 'W/"1"')
+
+
+class ThrottleRetryTests(ClientTestCase):
+    """Validate the retry of throttled POST requests."""
+
+    added = {"Id": 1, "OrganizationUnitId": 2, "QueueDefinitionId": 3}
+
+    def test_post_is_retried_on_429(self):
+        responses = iter([(429, {}, {"Retry-After": "2"}), (201, self.added, {})])
+        self.transport.route("POST", "UiPathODataSvc.AddQueueItem", lambda request: next(responses))
+
+        response = self.client.add_queue_item(fid="1", queue="queue", data={"a": 1}, reference="ref")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(self.transport.sent("POST", "UiPathODataSvc.AddQueueItem")), 2)
+        self.sleep.assert_called_once_with(2.0)
+
+    def test_post_is_not_retried_on_500(self):
+        self.transport.route("POST", "UiPathODataSvc.AddQueueItem", lambda request: (500, {}, {}))
+
+        response = self.client.add_queue_item(fid="1", queue="queue", data={"a": 1}, reference="ref")
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(len(self.transport.sent("POST", "UiPathODataSvc.AddQueueItem")), 1)
+        self.sleep.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()